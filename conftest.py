@@ -0,0 +1,11 @@
+# Command line options must be added from a conftest.py pytest loads at
+# startup, so this lives at the top level, where it is found regardless of
+# which test paths are given on the command line.
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--num-trials", type=int, default=10,
+        help="Number of trials to do for random content generation tests"
+        " (default: %(default)s)"
+    )
@@ -41,7 +41,7 @@ setup(
 
     extras_require={
         'jupyter': ['jupyter', 'stix2-viz'],
-        'tests': ['pytest', 'rdflib']
+        'tests': ['pytest', 'pytest-xdist', 'rdflib']
     },
 
     package_data={
@@ -1,3 +1,4 @@
+import functools
 import json
 import os.path
 
@@ -20,9 +21,32 @@ _STIX_REGISTRIES = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _read_registry_json(stix_version):
+    """
+    Read the built-in registry JSON file for the given STIX version.  Results
+    are cached, so each file is only read once.  The JSON text is what's
+    cached rather than the parsed registry, since callers are free to modify
+    the registries they get; parsing is also cheaper than deep-copying.
+
+    :param stix_version: a STIX version with a built-in registry
+    :return: The registry JSON, as a string
+    """
+    spec_registry_path = os.path.join(
+        os.path.dirname(__file__),
+        _STIX_REGISTRIES[stix_version]
+    )
+
+    with open(spec_registry_path, encoding="utf-8") as f:
+        spec_registry_json = f.read()
+
+    return spec_registry_json
+
+
 def _get_registry(stix_version):
     """
-    Get the object generator registry for the given STIX version.
+    Get the object generator registry for the given STIX version.  A new
+    registry is returned on each call, which the caller may modify.
 
     :param stix_version: a STIX version
     :return: An object generator registry, as parsed JSON
@@ -36,13 +60,7 @@ def _get_registry(stix_version):
     if stix_version not in _STIX_REGISTRIES:
         raise RegistryNotFoundError(stix_version)
 
-    spec_registry_path = os.path.join(
-        os.path.dirname(__file__),
-        _STIX_REGISTRIES[stix_version]
-    )
-
-    with open(spec_registry_path, encoding="utf-8") as f:
-        spec_registry = json.load(f)
+    spec_registry = json.loads(_read_registry_json(stix_version))
 
     return spec_registry
 
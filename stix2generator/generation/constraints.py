@@ -243,7 +243,7 @@ class PresenceCoconstraint:
 
 def _is_ref_prop(name):
     """Determine whether the given name names a "reference" property."""
-    return name.endswith("_ref") or name.endswith("_refs")
+    return name.endswith(("_ref", "_refs"))
 
 
 # This regex just splits a string into an operator and the stuff to its
@@ -1118,7 +1118,7 @@ def _get_properties_to_include(
     for name in effectively_optional_names:
 
         is_group = name in defined_group_names
-        is_ref = name.endswith("_ref") or name.endswith("_refs")
+        is_ref = name.endswith(("_ref", "_refs"))
 
         can_include = False
         if minimize_ref_properties:
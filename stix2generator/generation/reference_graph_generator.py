@@ -523,27 +523,40 @@ class ReferenceGraphGenerator:
     def config(self):
         return self.__config
 
-    def __random_generatable_seed_type(self, *constraints):
+    def __seed_type_candidates(self, seed_type):
         """
-        Pick a random seed type for a reference graph.
+        Find the STIX types a seed object may be generated as.
 
-        :return: A random generatable seed STIX type
+        :param seed_type: A STIX type, STIXTypeClass enum, or None.  If None,
+            all generatable STIX SDO and SCO types are candidates.
+        :return: A non-empty list of generatable STIX types
         :raises stix2generator.exceptions.GeneratableSTIXTypeNotFoundError: if
             a satisfying generatable STIX type could not be found
         """
 
-        stix_type = stix2generator.utils.random_generatable_stix_type(
+        if not seed_type:
+            constraints = (
+                stix2.utils.STIXTypeClass.SDO,
+                stix2.utils.STIXTypeClass.SCO
+            )
+        else:
+            # Might seem kinda silly if seed_type is directly given as a string,
+            # but this ensures that the given seed type is actually generatable
+            # with our object generator.
+            constraints = (seed_type,)
+
+        candidate_types = stix2generator.utils.generatable_stix_types(
             self.__object_generator,
             *constraints,
             stix_version=self.__stix_version
         )
 
-        if not stix_type:
+        if not candidate_types:
             raise stix2generator.exceptions.GeneratableSTIXTypeNotFoundError(
                 constraints, self.__stix_version
             )
 
-        return stix_type
+        return candidate_types
 
     def __augment_graph(self, object_, by_id, by_type, depth):
         """
@@ -673,16 +686,46 @@ class ReferenceGraphGenerator:
             created and returned.  It will contain all of the data from
             preexisting_objects plus the new content.
         """
-        if not seed_type:
-            seed_type = self.__random_generatable_seed_type(
-                stix2.utils.STIXTypeClass.SDO,
-                stix2.utils.STIXTypeClass.SCO
-            )
-        else:
-            # Might seem kinda silly if seed_type is directly given as a string,
-            # but this ensures that the given seed type is actually generatable
-            # with our object generator.
-            seed_type = self.__random_generatable_seed_type(seed_type)
+        candidate_types = self.__seed_type_candidates(seed_type)
+
+        return self.__generate(
+            random.choice(candidate_types), preexisting_objects
+        )
+
+    def generate_many(self, count, seed_type=None):
+        """
+        Generate several independent reference graphs, each seeded with an
+        object of the given type.  This is equivalent to calling generate()
+        count times, but the work of finding generatable seed types is done
+        only once.
+
+        :param count: The number of graphs to generate
+        :param seed_type: A STIX type, STIXTypeClass enum, or None.  See
+            generate().
+        :return: An iterator which produces count 2-tuples, as returned from
+            generate()
+        :raises stix2generator.exceptions.GeneratableSTIXTypeNotFoundError: if
+            a satisfying generatable STIX type could not be found
+        """
+
+        # Find candidates eagerly, so that errors are raised from this call
+        # rather than upon iteration.
+        candidate_types = self.__seed_type_candidates(seed_type)
+
+        return (
+            self.__generate(random.choice(candidate_types))
+            for _ in range(count)
+        )
+
+    def __generate(self, seed_type, preexisting_objects=None):
+        """
+        Generate a reference graph seeded with an object of the given type.
+
+        :param seed_type: A generatable STIX type
+        :param preexisting_objects: The pre-existing STIX content.  See
+            generate().
+        :return: A 2-tuple; see generate()
+        """
 
         # Pre-populate our data structures, if we were given pre-existing
         # objects.
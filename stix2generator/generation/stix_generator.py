@@ -70,7 +70,7 @@ def _random_id_of_types(by_type, *types, stix_version="2.1"):
     num_ids = sum(
         len(ids)
         for type_, ids in by_type.items()
-        if stix2.utils.is_stix_type(
+        if stix2generator.utils.is_stix_type(
             type_, stix_version, *types
         )
     )
@@ -82,7 +82,7 @@ def _random_id_of_types(by_type, *types, stix_version="2.1"):
         id_iter = itertools.chain.from_iterable(
             ids
             for type_, ids in by_type.items()
-            if stix2.utils.is_stix_type(
+            if stix2generator.utils.is_stix_type(
                 type_, stix_version, *types
             )
         )
@@ -105,7 +105,7 @@ def _is_sro_connectable(obj_or_type, stix_version):
     :param stix_version: A STIX version as a string
     :return: True if the type is connectable via SRO; False if not
     """
-    return stix2.utils.is_stix_type(
+    return stix2generator.utils.is_stix_type(
         obj_or_type,
         stix_version,
         stix2.utils.STIXTypeClass.SDO,
@@ -407,7 +407,9 @@ class STIXGenerator:
         """
 
         if any(
-                stix2.utils.is_sdo(type_, self.__stix_version)
+                stix2generator.utils.is_stix_type(
+                    type_, self.__stix_version, stix2.utils.STIXTypeClass.SDO
+                )
                 for type_ in by_type
         ):
             sighting = self.__object_generator.generate("sighting")
@@ -1,19 +1,30 @@
+import functools
+
 import pytest
 
 import stix2generator
 import stix2generator.generation.object_generator
+import stix2generator.generation.reference_graph_generator
+import stix2generator.generation.stix_generator
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "inv_prop_data(name): parametrize an inverse property constraint test"
+        " from the named data table in its module"
+    )
 
 
 @pytest.fixture(scope="session")
-def num_trials():
+def num_trials(request):
     """
     Since STIX content generation is random, depending on the test, we should
     do several trials so there is a greater chance for errors to occur.  This
     gives a global place to adjust how many trials are done for content
-    generation tests.
+    generation tests, via the --num-trials command line option.
     """
-    # ... or should this just be a global var imported into test modules?
-    return 10
+    return request.config.getoption("--num-trials")
 
 
 @pytest.fixture(scope="session")
@@ -24,6 +35,19 @@ def object_generator():
     return stix2generator.generation.object_generator.ObjectGenerator()
 
 
+@pytest.fixture(scope="session")
+def object_generator_no_minimize():
+    """
+    Creates an object generator for STIX 2.1 which does not minimize reference
+    properties.  Reference graph generation tests need this for graphs to grow.
+    """
+    config = stix2generator.generation.object_generator.Config(
+        minimize_ref_properties=False
+    )
+
+    return stix2generator.create_object_generator(config, None, "2.1")
+
+
 @pytest.fixture(scope="session")
 def stix21_generator():
     """
@@ -32,3 +56,50 @@ def stix21_generator():
     gen = stix2generator.create_stix_generator(stix_version="2.1")
 
     return gen
+
+
+@pytest.fixture(scope="session")
+def stix_generator_factory():
+    """
+    Provides a function which creates STIX 2.1 generators with the given
+    config settings.  The function accepts object_generator_config,
+    ref_graph_generator_config, and stix_generator_config keyword args, each
+    a dict of settings for the corresponding generator's config.  Generators
+    are cached, so each distinct configuration is only created once per test
+    session.
+    """
+    @functools.lru_cache(maxsize=None)
+    def make_cached(
+        object_generator_settings,
+        ref_graph_generator_settings,
+        stix_generator_settings
+    ):
+        object_generator_config = stix2generator.generation.object_generator\
+            .Config(**dict(object_generator_settings))
+        ref_graph_generator_config = stix2generator.generation\
+            .reference_graph_generator.Config(
+                **dict(ref_graph_generator_settings)
+            )
+        stix_generator_config = stix2generator.generation.stix_generator\
+            .Config(**dict(stix_generator_settings))
+
+        return stix2generator.create_stix_generator(
+            object_generator_config=object_generator_config,
+            ref_graph_generator_config=ref_graph_generator_config,
+            stix_generator_config=stix_generator_config,
+            stix_version="2.1"
+        )
+
+    def make(
+        object_generator_config=None,
+        ref_graph_generator_config=None,
+        stix_generator_config=None
+    ):
+        # Settings dicts aren't hashable; freeze them for use as cache keys.
+        return make_cached(
+            frozenset((object_generator_config or {}).items()),
+            frozenset((ref_graph_generator_config or {}).items()),
+            frozenset((stix_generator_config or {}).items())
+        )
+
+    return make
@@ -1,5 +1,10 @@
-import copy
+import collections
+import concurrent.futures
+import os
+import random
+import sys
 
+import faker
 import pytest
 import stix2
 import stix2.base
@@ -19,6 +24,72 @@ _TLP_MARKING_DEFINITION_IDS = {
 }
 
 
+def _make_ref_graph_gen(object_generator, **config_kwargs):
+    """
+    Create a reference graph generator for STIX 2.1 with the given config
+    settings.
+    """
+    graph_gen_config = stix2generator.generation.reference_graph_generator\
+        .Config(**config_kwargs)
+
+    return stix2generator.generation.reference_graph_generator\
+        .ReferenceGraphGenerator(
+            object_generator, graph_gen_config, stix_version="2.1"
+        )
+
+
+@pytest.fixture(scope="module")
+def ref_graph_gen(object_generator_no_minimize):
+    """
+    Creates a reference graph generator with default config.
+    """
+    return _make_ref_graph_gen(object_generator_no_minimize)
+
+
+@pytest.fixture(scope="module")
+def ref_graph_gen_random(object_generator_no_minimize):
+    """
+    Creates a reference graph generator which creates random graphs without
+    inverse properties.
+    """
+    return _make_ref_graph_gen(
+        object_generator_no_minimize,
+        graph_type="random",
+        inverse_property_constraints="delete"
+    )
+
+
+@pytest.fixture(scope="module")
+def ref_graph_gen_enforce(object_generator_no_minimize):
+    """
+    Creates a reference graph generator which enforces inverse property
+    constraints.
+    """
+    return _make_ref_graph_gen(
+        object_generator_no_minimize,
+        inverse_property_constraints="enforce"
+    )
+
+
+@pytest.fixture(scope="module")
+def ref_graph_gen_delete(object_generator_no_minimize):
+    """
+    Creates a reference graph generator which deletes inverse properties.
+    """
+    return _make_ref_graph_gen(
+        object_generator_no_minimize,
+        inverse_property_constraints="delete"
+    )
+
+
+@pytest.fixture(scope="module")
+def ref_graph_gen_no_parse(object_generator_no_minimize):
+    """
+    Creates a reference graph generator which produces plain dicts.
+    """
+    return _make_ref_graph_gen(object_generator_no_minimize, parse=False)
+
+
 @pytest.mark.parametrize(
     "seed_type", [
         "identity",
@@ -27,18 +98,8 @@ _TLP_MARKING_DEFINITION_IDS = {
         stix2.utils.STIXTypeClass.SRO
     ]
 )
-def test_seeds(num_trials, seed_type):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
-    )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
-
-    ref_graph_gen = stix2generator.generation.reference_graph_generator \
-        .ReferenceGraphGenerator(obj_gen, stix_version="2.1")
-
-    for _ in range(num_trials):
-
-        _, graph = ref_graph_gen.generate(seed_type)
+def test_seeds(num_trials, seed_type, ref_graph_gen):
+    for _, graph in ref_graph_gen.generate_many(num_trials, seed_type):
 
         # Ensure the graph has at least one object of type seed_type.
         assert any(
@@ -49,19 +110,71 @@ def test_seeds(num_trials, seed_type):
         )
 
 
-def test_bad_seed():
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
-    )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
+def test_bad_seed(ref_graph_gen):
+    with pytest.raises(
+        stix2generator.exceptions.GeneratableSTIXTypeNotFoundError
+    ):
+        ref_graph_gen.generate("foo")
 
-    ref_graph_gen = stix2generator.generation.reference_graph_generator \
-        .ReferenceGraphGenerator(obj_gen, stix_version="2.1")
 
+def test_generate_many(num_trials, ref_graph_gen):
+    results = list(ref_graph_gen.generate_many(num_trials, "identity"))
+
+    assert len(results) == num_trials
+    for seed_id, graph in results:
+        assert graph[seed_id]["type"] == "identity"
+
+
+def test_generate_many_bad_seed(ref_graph_gen):
+    # Should raise right away, not when the iterator is consumed
     with pytest.raises(
         stix2generator.exceptions.GeneratableSTIXTypeNotFoundError
     ):
-        ref_graph_gen.generate("foo")
+        ref_graph_gen.generate_many(1, "foo")
+
+
+_S = sys.intern
+
+
+def _inflate(spec):
+    """
+    Build a test object from the compact form used in _INV_PROP_TABLES:
+
+        (id, type, prop_name, value, prop_name, value, ...)
+
+    Tuple values become lists.  All strings are interned, since type names,
+    property names and IDs are compared constantly by the inverse property
+    constraint code, and interned strings let those comparisons succeed on
+    identity alone.  A new object is built on each call, so tests are free to
+    modify it.
+
+    :param spec: An object in compact form
+    :return: The object as a dict
+    """
+    obj = {
+        "id": _S(spec[0]),
+        "type": _S(spec[1])
+    }
+
+    for prop_name, value in zip(spec[2::2], spec[3::2]):
+        if isinstance(value, tuple):
+            value = [_S(elt) for elt in value]
+        else:
+            value = _S(value)
+
+        obj[_S(prop_name)] = value
+
+    return obj
+
+
+# The constraints exercised by the InversePropertyConstraint tests.  Constraint
+# objects are immutable, so these can be shared by all test cases.
+_C_DIFF = stix2generator.generation.reference_graph_generator\
+    .InversePropertyConstraint("type1", "prop1", "type2", "prop2")
+_C_SAME = stix2generator.generation.reference_graph_generator\
+    .InversePropertyConstraint("type1", "prop1", "type1", "prop2")
+_C_SAMEPROP = stix2generator.generation.reference_graph_generator\
+    .InversePropertyConstraint("type1", "prop1", "type1", "prop1")
 
 
 def _reverse_constraint(constraint):
@@ -80,147 +193,228 @@ def _reverse_constraint(constraint):
     return reversed_
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": "3"}),
+_C_DIFF_REV = _reverse_constraint(_C_DIFF)
+_C_SAME_REV = _reverse_constraint(_C_SAME)
+_C_SAMEPROP_REV = _reverse_constraint(_C_SAMEPROP)
 
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": ["99", "1"]}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": ["99", "3"]}),
+# Maps each shared constraint to its reversed counterpart, so tests of the
+# reversed orientation needn't construct anything.
+_REVERSED = {
+    _C_DIFF: _C_DIFF_REV,
+    _C_SAME: _C_SAME_REV,
+    _C_SAMEPROP: _C_SAMEPROP_REV
+}
 
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": "3"}),
 
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": ["99", "1"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": ["99", "3"]}),
-    ]
-)
-def test_inverse_property_constraint_applicable_diff_types(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type2", "prop2")
+# Test data for the InversePropertyConstraint tests, keyed by the name given to
+# the inv_prop_data mark.  Rows hold objects in the compact form accepted by
+# _inflate(); tests build the actual objects only when they run.
+_INV_PROP_TABLES = {
+    "applicable_diff_types": (
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", "1")),
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", "3")),
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", ("99", "1"))),
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", ("99", "3"))),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", "1")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", "3")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", ("99", "1"))),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", ("99", "3"))),
+    ),
+    "applicable_same_types": (
+        (("1", "type1", "prop1", "2", "prop2", "3"), ("2", "type1", "prop1", "3", "prop2", "1")),
+        (("1", "type1", "prop1", "2", "prop2", "2"), ("2", "type1", "prop1", "3", "prop2", ("99", "1"))),
+        (("1", "type1", "prop1", ("2", "99"), "prop2", "3"), ("2", "type1", "prop1", "1", "prop2", "1")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type1", "prop1", "99", "prop2", ("99", "3"))),
+    ),
+    "applicable_same_types_props": (
+        (("1", "type1", "prop1", "2"), ("2", "type1", "prop1", "1")),
+        (("1", "type1", "prop1", "2"), ("2", "type1", "prop1", "3")),
+    ),
+    "not_applicable_diff_types": (
+        # wrong references
+        (("1", "type1", "prop1", "3"), "prop1", ("2", "type2", "prop2", "4")),
+        (("1", "type1", "prop1", ("3", "99")), "prop1", ("2", "type2", "prop2", "1")),
+        (("1", "type1", "prop1", "3"), "prop1", ("2", "type2", "prop2", ("4", "1"))),
 
-    assert inv_prop_constraint.is_applicable(src_obj, "prop1", dest_obj)
+        # wrong properties
+        (("1", "type1", "prop1", "2"), "prop4", ("2", "type2", "prop4", "1")),
+        (("1", "type1", "prop3", ("2", "99")), "prop2", ("2", "type2", "prop2", "1")),
+        (("1", "type1", "prop3", "2"), "prop1", ("2", "type2", "prop4", ("99", "1"))),
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
-    assert reversed_constraint.is_applicable(src_obj, "prop1", dest_obj)
+        # wrong types
+        (("1", "type3", "prop1", "2"), "prop1", ("2", "type2", "prop2", "1")),
+        (("1", "type1", "prop1", ("2", "99")), "prop1", ("2", "type4", "prop2", "1")),
+        (("1", "type3", "prop1", "2"), "prop1", ("2", "type4", "prop2", ("99", "1"))),
+    ),
+    "not_applicable_same_types": (
+        # wrong references
+        (("1", "type1", "prop1", "3", "prop2", "2"), "prop1", ("2", "type1", "prop1", "1", "prop2", "4")),
+        (("1", "type1", "prop1", ("3", "99"), "prop2", "3"), "prop1", ("2", "type1", "prop1", "1", "prop2", "1")),
+        (("1", "type1", "prop1", "3", "prop2", "1"), "prop1", ("2", "type1", "prop1", "2", "prop2", ("4", "1"))),
 
+        # wrong properties
+        (("1", "type1", "prop1", "2", "prop2", "3"), "prop1", ("2", "type1", "prop4", "1")),
+        (("1", "type1", "prop3", ("2", "99")), "prop1", ("2", "type1", "prop2", "1")),
+        (("1", "type1", "prop3", "2"), "prop1", ("2", "type1", "prop4", ("99", "1"))),
+        (("1", "type1", "prop1", "2", "prop2", "3"), "prop3", ("2", "type1", "prop1", ("99", "1"), "prop2", "3")),
+    ),
+    "not_applicable_same_types_props": (
+        (("1", "type1", "prop1", "3"), "prop1", ("2", "type1", "prop1", "1")),
+        (("1", "type1", "prop1", "3"), "prop1", ("2", "type1", "prop1", "3")),
+        (("1", "type1", "prop1", "2"), "prop2", ("2", "type1", "prop1", "1")),
+        (("1", "type2", "prop1", "2"), "prop1", ("2", "type1", "prop1", "1")),
+        (("1", "type1", "prop2", "2"), "prop1", ("2", "type1", "prop1", "1")),
+    ),
+    "holds_diff_types": (
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", "1")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", "1")),
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", ("99", "1"))),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", ("99", "1"))),
+    ),
+    "holds_same_types": (
+        (("1", "type1", "prop1", "2", "prop2", "2"), ("2", "type1", "prop1", "4", "prop2", "1")),
+        (("1", "type1", "prop1", ("2", "99"), "prop2", "2"), ("2", "type1", "prop1", "4", "prop2", "1")),
+        (("1", "type1", "prop1", "2", "prop2", "99"), ("2", "type1", "prop1", "2", "prop2", ("99", "1"))),
+        (("1", "type1", "prop1", ("2", "99"), "prop2", "99"), ("2", "type1", "prop1", "2", "prop2", ("99", "1"))),
+    ),
+    "holds_same_types_props": (
+        (("1", "type1", "prop1", "2"), ("2", "type1", "prop1", "1")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type1", "prop1", "1")),
+        (("1", "type1", "prop1", "2"), ("2", "type1", "prop1", ("99", "1"))),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type1", "prop1", ("99", "1"))),
+    ),
+    "not_holds_diff_types": (
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", "4")),
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", ("2", "99"))),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", "4")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", ("99", "2"))),
+    ),
+    "not_holds_same_types": (
+        (("1", "type1", "prop1", "2", "prop2", "2"), ("2", "type1", "prop1", "1", "prop2", "4")),
+        (("1", "type1", "prop1", "2", "prop2", "2"), ("2", "type1", "prop1", "1", "prop2", ("4", "99"))),
+        (("1", "type1", "prop1", ("2", "99"), "prop2", "2"), ("2", "type1", "prop1", "1", "prop2", "4")),
+        (("1", "type1", "prop1", ("2", "99"), "prop2", "2"), ("2", "type1", "prop1", "1", "prop2", ("99", "4"))),
+    ),
+    "not_holds_same_types_props": (
+        (("1", "type1", "prop1", "2"), ("2", "type1", "prop1", "2")),
+        (("1", "type1", "prop1", "2"), ("2", "type1", "prop1", "3")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type1", "prop1", "4")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type1", "prop1", ("2", "3"))),
+    ),
+    "enforce_diff_types": (
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", "4")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", "4")),
+        (("1", "type1", "prop1", "2"), ("2", "type2", "prop2", ("4", "99"))),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type2", "prop2", ("4", "99"))),
+    ),
+    "enforce_same_types": (
+        (("1", "type1", "prop1", "2", "prop2", "2"), ("2", "type1", "prop1", "2", "prop2", "4")),
+        (("1", "type1", "prop1", ("2", "99"), "prop2", "2"), ("2", "type1", "prop1", "3", "prop2", "4")),
+        (("1", "type1", "prop1", "2", "prop2", "3"), ("2", "type1", "prop1", "1", "prop2", ("4", "99"))),
+        (("1", "type1", "prop1", ("2", "99"), "prop2", "3"), ("2", "type1", "prop1", "1", "prop2", ("4", "99"))),
+    ),
+    "enforce_same_types_props": (
+        (("1", "type1", "prop1", "2"), ("2", "type1", "prop1", "3")),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type1", "prop1", "3")),
+        (("1", "type1", "prop1", "2"), ("2", "type1", "prop1", ("4", "99"))),
+        (("1", "type1", "prop1", ("2", "99")), ("2", "type1", "prop1", ("4", "99"))),
+    ),
+}
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize tests marked with inv_prop_data from _INV_PROP_TABLES.  Rows
+    are either (src_spec, dest_spec) or (src_spec, ref_prop, dest_spec).
+    """
+    marker = metafunc.definition.get_closest_marker("inv_prop_data")
+    if marker is not None:
+        rows = _INV_PROP_TABLES[marker.args[0]]
+        if len(rows[0]) == 2:
+            argnames = "src_spec, dest_spec"
+        else:
+            argnames = "src_spec, ref_prop, dest_spec"
+
+        metafunc.parametrize(argnames, rows)
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "3"}, {"id": "2", "type": "type1", "prop1": "3", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "3", "prop2": ["99", "1"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"], "prop2": "3"}, {"id": "2", "type": "type1", "prop1": "1", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type1", "prop1": "99", "prop2": ["99", "3"]}),
-    ]
-)
-def test_inverse_property_constraint_applicable_same_types(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop2")
+
+@pytest.mark.inv_prop_data("applicable_diff_types")
+def test_inverse_property_constraint_applicable_diff_types(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_DIFF
 
     assert inv_prop_constraint.is_applicable(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert reversed_constraint.is_applicable(src_obj, "prop1", dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type1", "prop1": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type1", "prop1": "3"})
-    ]
-)
-def test_inverse_property_constraint_applicable_same_types_props(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop1")
+@pytest.mark.inv_prop_data("applicable_same_types")
+def test_inverse_property_constraint_applicable_same_types(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAME
 
     assert inv_prop_constraint.is_applicable(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert reversed_constraint.is_applicable(src_obj, "prop1", dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, ref_prop, dest_obj", [
-        # wrong references
-        ({"id": "1", "type": "type1", "prop1": "3"}, "prop1", {"id": "2", "type": "type2", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": ["3", "99"]}, "prop1", {"id": "2", "type": "type2", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "3"}, "prop1", {"id": "2", "type": "type2", "prop2": ["4", "1"]}),
+@pytest.mark.inv_prop_data("applicable_same_types_props")
+def test_inverse_property_constraint_applicable_same_types_props(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAMEPROP
 
-        # wrong properties
-        ({"id": "1", "type": "type1", "prop1": "2"}, "prop4", {"id": "2", "type": "type2", "prop4": "1"}),
-        ({"id": "1", "type": "type1", "prop3": ["2", "99"]}, "prop2", {"id": "2", "type": "type2", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop3": "2"}, "prop1", {"id": "2", "type": "type2", "prop4": ["99", "1"]}),
+    assert inv_prop_constraint.is_applicable(src_obj, "prop1", dest_obj)
 
-        # wrong types
-        ({"id": "1", "type": "type3", "prop1": "2"}, "prop1", {"id": "2", "type": "type2", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, "prop1", {"id": "2", "type": "type4", "prop2": "1"}),
-        ({"id": "1", "type": "type3", "prop1": "2"}, "prop1", {"id": "2", "type": "type4", "prop2": ["99", "1"]}),
-    ]
-)
-def test_inverse_property_constraint_not_applicable_diff_types(src_obj, ref_prop, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type2", "prop2")
+    reversed_constraint = _REVERSED[inv_prop_constraint]
+    assert reversed_constraint.is_applicable(src_obj, "prop1", dest_obj)
+
+
+@pytest.mark.inv_prop_data("not_applicable_diff_types")
+def test_inverse_property_constraint_not_applicable_diff_types(src_spec, ref_prop, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_DIFF
 
     assert not inv_prop_constraint.is_applicable(src_obj, ref_prop, dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert not reversed_constraint.is_applicable(src_obj, ref_prop, dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, ref_prop, dest_obj", [
-        # wrong references
-        ({"id": "1", "type": "type1", "prop1": "3", "prop2": "2"}, "prop1", {"id": "2", "type": "type1", "prop1": "1", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": ["3", "99"], "prop2": "3"}, "prop1", {"id": "2", "type": "type1", "prop1": "1", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "3", "prop2": "1"}, "prop1", {"id": "2", "type": "type1", "prop1": "2", "prop2": ["4", "1"]}),
-
-        # wrong properties
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "3"}, "prop1", {"id": "2", "type": "type1", "prop4": "1"}),
-        ({"id": "1", "type": "type1", "prop3": ["2", "99"]}, "prop1", {"id": "2", "type": "type1", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop3": "2"}, "prop1", {"id": "2", "type": "type1", "prop4": ["99", "1"]}),
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "3"}, "prop3", {"id": "2", "type": "type1", "prop1": ["99", "1"], "prop2": "3"}),
-    ]
-)
-def test_inverse_property_constraint_not_applicable_same_types(src_obj, ref_prop, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop2")
+@pytest.mark.inv_prop_data("not_applicable_same_types")
+def test_inverse_property_constraint_not_applicable_same_types(src_spec, ref_prop, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAME
 
     assert not inv_prop_constraint.is_applicable(src_obj, ref_prop, dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert not reversed_constraint.is_applicable(src_obj, ref_prop, dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, ref_prop, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "3"}, "prop1", {"id": "2", "type": "type1", "prop1": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "3"}, "prop1", {"id": "2", "type": "type1", "prop1": "3"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, "prop2", {"id": "2", "type": "type1", "prop1": "1"}),
-        ({"id": "1", "type": "type2", "prop1": "2"}, "prop1", {"id": "2", "type": "type1", "prop1": "1"}),
-        ({"id": "1", "type": "type1", "prop2": "2"}, "prop1", {"id": "2", "type": "type1", "prop1": "1"}),
-    ]
-)
-def test_inverse_property_constraint_not_applicable_same_types_props(src_obj, ref_prop, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop1")
+@pytest.mark.inv_prop_data("not_applicable_same_types_props")
+def test_inverse_property_constraint_not_applicable_same_types_props(src_spec, ref_prop, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAMEPROP
 
     assert not inv_prop_constraint.is_applicable(src_obj, ref_prop, dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert not reversed_constraint.is_applicable(src_obj, ref_prop, dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": ["99", "1"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": ["99", "1"]}),
-    ]
-)
-def test_inverse_property_constraint_holds_diff_types(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type2", "prop2")
+@pytest.mark.inv_prop_data("holds_diff_types")
+def test_inverse_property_constraint_holds_diff_types(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_DIFF
 
     # Ensure I didn't mess up the test case...
     # .holds() assumes .is_applicable().
@@ -228,21 +422,15 @@ def test_inverse_property_constraint_holds_diff_types(src_obj, dest_obj):
 
     assert inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert reversed_constraint.holds(src_obj, "prop1", dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "4", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"], "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "4", "prop2": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "99"}, {"id": "2", "type": "type1", "prop1": "2", "prop2": ["99", "1"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"], "prop2": "99"}, {"id": "2", "type": "type1", "prop1": "2", "prop2": ["99", "1"]}),
-    ]
-)
-def test_inverse_property_constraint_holds_same_types(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop2")
+@pytest.mark.inv_prop_data("holds_same_types")
+def test_inverse_property_constraint_holds_same_types(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAME
 
     # Ensure I didn't mess up the test case...
     # .holds() assumes .is_applicable().
@@ -250,21 +438,15 @@ def test_inverse_property_constraint_holds_same_types(src_obj, dest_obj):
 
     assert inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert reversed_constraint.holds(src_obj, "prop1", dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type1", "prop1": "1"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type1", "prop1": "1"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type1", "prop1": ["99", "1"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type1", "prop1": ["99", "1"]}),
-    ]
-)
-def test_inverse_property_constraint_holds_same_types_props(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop1")
+@pytest.mark.inv_prop_data("holds_same_types_props")
+def test_inverse_property_constraint_holds_same_types_props(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAMEPROP
 
     # Ensure I didn't mess up the test case...
     # .holds() assumes .is_applicable().
@@ -272,21 +454,15 @@ def test_inverse_property_constraint_holds_same_types_props(src_obj, dest_obj):
 
     assert inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert reversed_constraint.holds(src_obj, "prop1", dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": ["2", "99"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": ["99", "2"]}),
-    ]
-)
-def test_inverse_property_constraint_not_holds_diff_types(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type2", "prop2")
+@pytest.mark.inv_prop_data("not_holds_diff_types")
+def test_inverse_property_constraint_not_holds_diff_types(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_DIFF
 
     # Ensure I didn't mess up the test case...
     # .holds() assumes .is_applicable().
@@ -294,21 +470,15 @@ def test_inverse_property_constraint_not_holds_diff_types(src_obj, dest_obj):
 
     assert not inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert not reversed_constraint.holds(src_obj, "prop1", dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "1", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "1", "prop2": ["4", "99"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"], "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "1", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"], "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "1", "prop2": ["99", "4"]}),
-    ]
-)
-def test_inverse_property_constraint_not_holds_same_types(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop2")
+@pytest.mark.inv_prop_data("not_holds_same_types")
+def test_inverse_property_constraint_not_holds_same_types(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAME
 
     # Ensure I didn't mess up the test case...
     # .holds() assumes .is_applicable().
@@ -316,21 +486,15 @@ def test_inverse_property_constraint_not_holds_same_types(src_obj, dest_obj):
 
     assert not inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert not reversed_constraint.holds(src_obj, "prop1", dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type1", "prop1": "2"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type1", "prop1": "3"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type1", "prop1": "4"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type1", "prop1": ["2", "3"]}),
-    ]
-)
-def test_inverse_property_constraint_not_holds_same_types_props(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop1")
+@pytest.mark.inv_prop_data("not_holds_same_types_props")
+def test_inverse_property_constraint_not_holds_same_types_props(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAMEPROP
 
     # Ensure I didn't mess up the test case...
     # .holds() assumes .is_applicable().
@@ -338,81 +502,63 @@ def test_inverse_property_constraint_not_holds_same_types_props(src_obj, dest_ob
 
     assert not inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     assert not reversed_constraint.holds(src_obj, "prop1", dest_obj)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type2", "prop2": ["4", "99"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type2", "prop2": ["4", "99"]}),
-    ]
-)
-def test_inverse_property_constraint_enforce_diff_types(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type2", "prop2")
+@pytest.mark.inv_prop_data("enforce_diff_types")
+def test_inverse_property_constraint_enforce_diff_types(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_DIFF
 
     # Copies for reverse test to work on
-    src_copy = copy.deepcopy(src_obj)
-    dest_copy = copy.deepcopy(dest_obj)
+    src_copy = _inflate(src_spec)
+    dest_copy = _inflate(dest_spec)
 
     assert inv_prop_constraint.is_applicable(src_obj, "prop1", dest_obj)
     inv_prop_constraint.enforce(src_obj, "prop1", dest_obj)
     assert inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     reversed_constraint.enforce(src_copy, "prop1", dest_copy)
     assert reversed_constraint.holds(src_copy, "prop1", dest_copy)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "2", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"], "prop2": "2"}, {"id": "2", "type": "type1", "prop1": "3", "prop2": "4"}),
-        ({"id": "1", "type": "type1", "prop1": "2", "prop2": "3"}, {"id": "2", "type": "type1", "prop1": "1", "prop2": ["4", "99"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"], "prop2": "3"}, {"id": "2", "type": "type1", "prop1": "1", "prop2": ["4", "99"]}),
-    ]
-)
-def test_inverse_property_constraint_enforce_same_types(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop2")
+@pytest.mark.inv_prop_data("enforce_same_types")
+def test_inverse_property_constraint_enforce_same_types(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAME
 
     # Copies for reverse test to work on
-    src_copy = copy.deepcopy(src_obj)
-    dest_copy = copy.deepcopy(dest_obj)
+    src_copy = _inflate(src_spec)
+    dest_copy = _inflate(dest_spec)
 
     assert inv_prop_constraint.is_applicable(src_obj, "prop1", dest_obj)
     inv_prop_constraint.enforce(src_obj, "prop1", dest_obj)
     assert inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     reversed_constraint.enforce(src_copy, "prop1", dest_copy)
     assert reversed_constraint.holds(src_copy, "prop1", dest_copy)
 
 
-@pytest.mark.parametrize(
-    "src_obj, dest_obj", [
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type1", "prop1": "3"}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type1", "prop1": "3"}),
-        ({"id": "1", "type": "type1", "prop1": "2"}, {"id": "2", "type": "type1", "prop1": ["4", "99"]}),
-        ({"id": "1", "type": "type1", "prop1": ["2", "99"]}, {"id": "2", "type": "type1", "prop1": ["4", "99"]}),
-    ]
-)
-def test_inverse_property_constraint_enforce_same_types_props(src_obj, dest_obj):
-    inv_prop_constraint = stix2generator.generation.reference_graph_generator\
-        .InversePropertyConstraint("type1", "prop1", "type1", "prop1")
+@pytest.mark.inv_prop_data("enforce_same_types_props")
+def test_inverse_property_constraint_enforce_same_types_props(src_spec, dest_spec):
+    src_obj = _inflate(src_spec)
+    dest_obj = _inflate(dest_spec)
+    inv_prop_constraint = _C_SAMEPROP
 
     # Copies for reverse test to work on
-    src_copy = copy.deepcopy(src_obj)
-    dest_copy = copy.deepcopy(dest_obj)
+    src_copy = _inflate(src_spec)
+    dest_copy = _inflate(dest_spec)
 
     assert inv_prop_constraint.is_applicable(src_obj, "prop1", dest_obj)
     inv_prop_constraint.enforce(src_obj, "prop1", dest_obj)
     assert inv_prop_constraint.holds(src_obj, "prop1", dest_obj)
 
-    reversed_constraint = _reverse_constraint(inv_prop_constraint)
+    reversed_constraint = _REVERSED[inv_prop_constraint]
     reversed_constraint.enforce(src_copy, "prop1", dest_copy)
     assert reversed_constraint.holds(src_copy, "prop1", dest_copy)
 
@@ -533,29 +679,22 @@ def test_find_property_constraints_missing_inverse():
 
 
 @pytest.mark.parametrize(
-    "src_obj_type, ref_prop, dest_obj_type", [
+    "expected, src_obj_type, ref_prop, dest_obj_type", [
         # just pick some types/props we know imply constraints
-        ("process", "child_refs", "process"),
-        ("process", "parent_ref", "process"),
-        ("network-traffic", "encapsulates_refs", "network-traffic"),
-        ("directory", "contains_refs", "file")
+        (True, "process", "child_refs", "process"),
+        (True, "process", "parent_ref", "process"),
+        (True, "network-traffic", "encapsulates_refs", "network-traffic"),
+        (True, "directory", "contains_refs", "file"),
+
+        (False, "file", "content_ref", "artifact"),
+        (False, "network-traffic", "object_marking_refs", "marking-definition"),
+        (False, "process", "image_ref", "file"),
     ]
 )
-def test_would_be_constrained(src_obj_type, ref_prop, dest_obj_type):
+def test_would_be_constrained(expected, src_obj_type, ref_prop, dest_obj_type):
     assert stix2generator.generation.reference_graph_generator\
-        ._would_be_constrained(src_obj_type, ref_prop, dest_obj_type)
-
-
-@pytest.mark.parametrize(
-    "src_obj_type, ref_prop, dest_obj_type", [
-        ("file", "content_ref", "artifact"),
-        ("network-traffic", "object_marking_refs", "marking-definition"),
-        ("process", "image_ref", "file"),
-    ]
-)
-def test_would_not_be_constrained(src_obj_type, ref_prop, dest_obj_type):
-    assert not stix2generator.generation.reference_graph_generator\
-        ._would_be_constrained(src_obj_type, ref_prop, dest_obj_type)
+        ._would_be_constrained(src_obj_type, ref_prop, dest_obj_type) \
+        is expected
 
 
 @pytest.mark.parametrize(
@@ -608,19 +747,9 @@ def test_delete_inverse_properties(src_obj, ref_prop, dest_obj):
     )
 
 
-def test_no_dangling_references(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
-    )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
-    ref_graph_gen = stix2generator.generation.reference_graph_generator \
-        .ReferenceGraphGenerator(
-            obj_gen
-        )
-
-    for _ in range(num_trials):
-        _, graph = ref_graph_gen.generate()
-        assert not stix2generator.test.utils.has_dangling_references(graph)
+def test_no_dangling_references(num_trials, ref_graph_gen):
+    for _, graph in ref_graph_gen.generate_many(num_trials):
+        assert not stix2generator.test.utils.dangling_references(graph)
 
 
 def _has_cycle(graph):
@@ -634,16 +763,9 @@ def _has_cycle(graph):
                     ._is_reachable(
                         ref_id, id_, graph
                     ):
-                result = True
-                break
-        else:
-            continue
+                return True
 
-        break
-    else:
-        result = False
-
-    return result
+    return False
 
 
 def _has_reuse(graph):
@@ -660,244 +782,340 @@ def _has_reuse(graph):
                 continue
 
             other_referrer_id = referrers.get(ref_id)
-            if other_referrer_id is None:
-                referrers[ref_id] = id_
+            if other_referrer_id is not None:
+                return True
 
-            else:
-                result = True
-                break
-        else:
-            continue
+            referrers[ref_id] = id_
 
-        break
+    return False
 
-    else:
-        result = False
-
-    return result
 
+@pytest.fixture(scope="module", params=["tree", "dag"])
+def graph_typed_gen(request, object_generator_no_minimize):
+    """
+    Creates reference graph generators for the acyclic graph types, which
+    delete inverse properties so that acyclicity is actually achievable.
 
-def test_graph_tree(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
+    :return: A (graph type, reference graph generator) 2-tuple
+    """
+    ref_graph_gen = _make_ref_graph_gen(
+        object_generator_no_minimize,
+        graph_type=request.param,
+        inverse_property_constraints="delete"
     )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
-    graph_gen_config = stix2generator.generation.reference_graph_generator\
-        .Config(
-            graph_type="tree",
-            inverse_property_constraints="delete"
-        )
 
-    ref_graph_gen = stix2generator.generation.reference_graph_generator\
-        .ReferenceGraphGenerator(obj_gen, graph_gen_config)
+    return request.param, ref_graph_gen
 
-    for _ in range(num_trials):
-        _, graph = ref_graph_gen.generate()
+
+def test_graph_topology(graph_typed_gen, num_trials):
+    graph_type, ref_graph_gen = graph_typed_gen
+
+    for _, graph in ref_graph_gen.generate_many(num_trials):
         assert not _has_cycle(graph)
-        assert not _has_reuse(graph)
-        assert not stix2generator.test.utils.has_dangling_references(graph)
-        assert stix2generator.test.utils.is_connected(graph)
+        if graph_type == "tree":
+            assert not _has_reuse(graph)
+        references = stix2generator.test.utils.find_graph_references(graph)
+        assert not stix2generator.test.utils.has_dangling_references(
+            graph, references
+        )
+        assert stix2generator.test.utils.is_connected(graph, references)
 
 
-def test_graph_dag(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
+# Graph checks can cost as much as generation.  Set STIX2GEN_CHECK_EVERY to K
+# to check only every Kth graph generated by _run_trials(); the rest are just
+# generated, which still catches generation errors.  Defaults to checking all.
+_CHECK_EVERY = int(os.environ.get("STIX2GEN_CHECK_EVERY", "1"))
+if _CHECK_EVERY < 1:
+    raise ValueError(
+        "STIX2GEN_CHECK_EVERY must be at least 1: {}".format(_CHECK_EVERY)
     )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
-    graph_gen_config = stix2generator.generation.reference_graph_generator\
-        .Config(
-            graph_type="dag",
-            inverse_property_constraints="delete"
-        )
 
-    ref_graph_gen = stix2generator.generation.reference_graph_generator\
-        .ReferenceGraphGenerator(obj_gen, graph_gen_config)
 
-    for _ in range(num_trials):
-        _, graph = ref_graph_gen.generate()
-        assert not _has_cycle(graph)
-        assert not stix2generator.test.utils.has_dangling_references(graph)
-        assert stix2generator.test.utils.is_connected(graph)
+# The reference graph generator used by _run_trials() worker processes.  Set
+# once per worker by _init_trial_worker(), so the generator is pickled once per
+# worker rather than once per trial.
+_worker_ref_graph_gen = None
 
 
-def test_graph_random(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
-    )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
-    graph_gen_config = stix2generator.generation.reference_graph_generator\
-        .Config(
-            graph_type="random",
-            inverse_property_constraints="delete"
-        )
+def _init_trial_worker(ref_graph_gen):
+    """
+    Worker process initializer for _run_trials().
 
-    ref_graph_gen = stix2generator.generation.reference_graph_generator\
-        .ReferenceGraphGenerator(obj_gen, graph_gen_config)
+    :param ref_graph_gen: The reference graph generator to use for trials
+    """
+    global _worker_ref_graph_gen
+    _worker_ref_graph_gen = ref_graph_gen
 
-    for _ in range(num_trials):
-        _, graph = ref_graph_gen.generate()
-        assert not stix2generator.test.utils.has_dangling_references(graph)
-        assert stix2generator.test.utils.is_connected(graph)
 
+def _worker_trial(seed_type, check, seed):
+    """
+    Generate a graph and check it, in a worker process.  Module-level so it
+    can be run in worker processes.
+
+    :param seed_type: A seed type for graph generation, or None
+    :param check: A graph predicate, or None to skip checking.  Must be
+        picklable, i.e. a module-level function.
+    :param seed: A seed for random number generation.  Worker processes
+        inherit their parent's random state, so must be given distinct seeds
+        to generate different graphs.
+    :return: The graph if it failed the check; None if it passed or wasn't
+        checked
+    """
+    random.seed(seed)
+    faker.Faker.seed(seed)
+
+    _, graph = _worker_ref_graph_gen.generate(seed_type)
+
+    if check and not check(graph):
+        result = graph
+    else:
+        result = None
+
+    return result
+
+
+def _run_trials(ref_graph_gen, num_trials, check, seed_type=None):
+    """
+    Generate num_trials graphs and assert that each passes the given check (or
+    every _CHECK_EVERY'th graph, if that is greater than 1).  Trials are
+    independent, so they are spread over PYTEST_WORKERS worker processes if
+    that environment variable is set to more than 1.  Otherwise, they run
+    serially, which is faster unless num_trials is large.
+
+    :param ref_graph_gen: A reference graph generator
+    :param num_trials: The number of graphs to generate
+    :param check: A graph predicate.  Must be a module-level function.
+    :param seed_type: A seed type for graph generation, or None
+    """
+    workers = int(os.environ.get("PYTEST_WORKERS", "1"))
 
-def _objects_of_type(graph, type_):
+    checks = [
+        check if i % _CHECK_EVERY == 0 else None
+        for i in range(num_trials)
+    ]
+
+    if workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=_init_trial_worker,
+            initargs=(ref_graph_gen,)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _worker_trial, seed_type, trial_check,
+                    random.getrandbits(64)
+                )
+                for trial_check in checks
+            ]
+
+            for i, future in enumerate(futures):
+                failed_graph = future.result()
+                assert failed_graph is None, \
+                    "trial {} failed: {}".format(i, failed_graph)
+
+    else:
+        for i, trial_check in enumerate(checks):
+            _, graph = ref_graph_gen.generate(seed_type)
+            if trial_check:
+                assert trial_check(graph), \
+                    "trial {} failed: {}".format(i, graph)
+
+
+def _connected_without_dangling_references(graph):
+    references = stix2generator.test.utils.find_graph_references(graph)
+
+    return not stix2generator.test.utils.has_dangling_references(
+        graph, references
+    ) and stix2generator.test.utils.is_connected(graph, references)
+
+
+def _index_by_type(graph):
+    """
+    Index the objects of a graph by type.
+
+    :param graph: The graph, as map from ID to object
+    :return: A map from STIX type to a list of objects of that type
+    """
+    index = collections.defaultdict(list)
     for obj in graph.values():
-        if obj["type"] == type_:
-            yield obj
+        index[obj["type"]].append(obj)
+
+    return index
+
+
+def _object_pairs_of_types(index, type1, type2):
+    """
+    Generate all pairs of distinct objects of the given types.
 
+    :param index: A graph index, as produced by _index_by_type()
+    :param type1: A STIX type for the first object of each pair
+    :param type2: A STIX type for the second object of each pair
+    """
+    objs1 = index.get(type1)
+    objs2 = index.get(type2)
+
+    # Most constraint type pairs will be absent from any given graph; bail
+    # before setting up any iteration if there can be no pairs.
+    if not objs1 or not objs2:
+        return
 
-def _object_pairs_of_types(graph, type1, type2):
-    for obj1 in _objects_of_type(graph, type1):
-        for obj2 in _objects_of_type(graph, type2):
+    for obj1 in objs1:
+        for obj2 in objs2:
             if obj1 is not obj2:
                 yield obj1, obj2
 
 
-def _constraints_enforced(graph):
+def _group_constraints_by_types():
     """
-    Check if all applicable constraints have been enforced in the given graph.
+    Group the inverse property constraints by the pair of object types they
+    apply to, so that each pair of objects need only be found once.
 
-    :return: True if all applicable constraints are enforced; False if not
+    :return: A map from (object_type1, object_type2) to a list of
+        (constraint, prop_name1, prop_name2) triples
     """
+    constraints_by_types = collections.defaultdict(list)
     for constraint in stix2generator.generation.reference_graph_generator\
             ._INVERSE_PROPERTIES:
-        for obj1, obj2 in _object_pairs_of_types(
-            graph, constraint.object_type1, constraint.object_type2
-        ):
-            if (
-                constraint.is_applicable(obj1, constraint.prop_name1, obj2)
-                and not constraint.holds(obj1, constraint.prop_name1, obj2)
-            ) or (
-                constraint.is_applicable(obj1, constraint.prop_name2, obj2)
-                and not constraint.holds(obj1, constraint.prop_name2, obj2)
-            ):
-                result = False
-                break
+        constraints_by_types[
+            (constraint.object_type1, constraint.object_type2)
+        ].append(
+            (constraint, constraint.prop_name1, constraint.prop_name2)
+        )
 
-        else:
-            continue
+    return constraints_by_types
 
-        break
-    else:
-        result = True
 
-    return result
+_CONSTRAINTS_BY_TYPES = _group_constraints_by_types()
 
 
-def _constraints_applicable(graph):
+# All object types involved in any inverse property constraint.  A graph with
+# none of these types can't have any applicable constraints.
+_INV_TYPES = frozenset(
+    type_
+    for type1, type2 in _CONSTRAINTS_BY_TYPES
+    for type_ in (type1, type2)
+)
+
+
+def _constraint_pairs(index):
     """
-    Check whether there are any applicable constraints on objects in the given
-    graph.
+    Generate all (constraint, obj1, obj2) triples such that obj1 and obj2 are
+    distinct objects with the types of the constraint, and the constraint
+    could be applicable to them.
 
-    :param graph: The graph, as map from ID to object
-    :return: True if any constraint applies to any objects; False if not
+    :param index: A graph index, as produced by _index_by_type()
     """
-    for constraint in stix2generator.generation.reference_graph_generator\
-            ._INVERSE_PROPERTIES:
-        for obj1, obj2 in _object_pairs_of_types(
-            graph, constraint.object_type1, constraint.object_type2
-        ):
-            if constraint.is_applicable(
-                obj1, constraint.prop_name1, obj2
-            ) or constraint.is_applicable(
-                obj1, constraint.prop_name2, obj2
-            ):
-                result = True
-                break
+    for (type1, type2), constraints in _CONSTRAINTS_BY_TYPES.items():
+        for obj1, obj2 in _object_pairs_of_types(index, type1, type2):
+            for constraint, prop_name1, prop_name2 in constraints:
+                # A constraint can only be applicable if one object has one of
+                # the properties and the other object has the other.  Most
+                # objects have neither, so check property presence before
+                # doing any more expensive checks.
+                if (prop_name1 in obj1 and prop_name2 in obj2) \
+                        or (prop_name2 in obj1 and prop_name1 in obj2):
+                    yield constraint, obj1, obj2
 
-        else:
-            continue
 
-        break
-    else:
-        result = False
+def _constraints_enforced(graph):
+    """
+    Check if all applicable constraints have been enforced in the given graph.
 
-    return result
+    :return: True if all applicable constraints are enforced; False if not
+    """
+    index = _index_by_type(graph)
 
+    if _INV_TYPES.isdisjoint(index):
+        return True
 
-def test_graph_enforce_inverse_properties(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
-    )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
+    for constraint, obj1, obj2 in _constraint_pairs(index):
+        for ref_prop in (constraint.prop_name1, constraint.prop_name2):
+            if constraint.is_applicable(obj1, ref_prop, obj2) \
+                    and not constraint.holds(obj1, ref_prop, obj2):
+                return False
 
-    graph_gen_config = stix2generator.generation.reference_graph_generator\
-        .Config(
-            inverse_property_constraints="enforce"
-        )
-    ref_graph_gen = stix2generator.generation.reference_graph_generator\
-        .ReferenceGraphGenerator(obj_gen, graph_gen_config)
+    return True
 
-    for _ in range(num_trials):
-        # I feel like I should hard-code a STIX object type I know to contain
-        # lots of reference properties and have applicable constraints, to have
-        # a high likelihood that reference properties will be generated, the
-        # graph will grow, and there will be some applicable constraints to
-        # test.
-        _, graph = ref_graph_gen.generate("network-traffic")
-        assert _constraints_enforced(graph)
 
+def _constraints_applicable(graph):
+    """
+    Check whether there are any applicable constraints on objects in the given
+    graph.
 
-def test_graph_delete_inverse_properties(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
+    :param graph: The graph, as map from ID to object
+    :return: True if any constraint applies to any objects; False if not
+    """
+    index = _index_by_type(graph)
+
+    if _INV_TYPES.isdisjoint(index):
+        return False
+
+    for constraint, obj1, obj2 in _constraint_pairs(index):
+        if constraint.is_applicable(obj1, constraint.prop_name1, obj2) \
+                or constraint.is_applicable(obj1, constraint.prop_name2, obj2):
+            return True
+
+    return False
+
+
+def _constraints_not_applicable(graph):
+    return not _constraints_applicable(graph)
+
+
+# Maps a graph generation mode to the name of a reference graph generator
+# fixture, a seed type, and a check which must hold for all graphs generated.
+#
+# For the inverse property modes, I feel like I should hard-code a STIX object
+# type I know to contain lots of reference properties and have applicable
+# constraints, to have a high likelihood that reference properties will be
+# generated, the graph will grow, and there will be some applicable
+# constraints to test.
+_GRAPH_MODES = {
+    "random": (
+        "ref_graph_gen_random", None, _connected_without_dangling_references
+    ),
+    "enforce": (
+        "ref_graph_gen_enforce", "network-traffic", _constraints_enforced
+    ),
+    "delete": (
+        "ref_graph_gen_delete", "network-traffic", _constraints_not_applicable
     )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
+}
 
-    graph_gen_config = stix2generator.generation.reference_graph_generator\
-        .Config(
-            inverse_property_constraints="delete"
-        )
-    ref_graph_gen = stix2generator.generation.reference_graph_generator\
-        .ReferenceGraphGenerator(obj_gen, graph_gen_config)
 
-    for _ in range(num_trials):
-        # I feel like I should hard-code a STIX object type I know to contain
-        # lots of reference properties and have applicable constraints, to have
-        # a high likelihood that reference properties will be generated, the
-        # graph will grow, and there will be some applicable constraints to
-        # test.
-        _, graph = ref_graph_gen.generate("network-traffic")
-        assert not _constraints_applicable(graph)
+@pytest.mark.parametrize("mode", list(_GRAPH_MODES))
+def test_graph(request, mode, num_trials):
+    fixture_name, seed_type, check = _GRAPH_MODES[mode]
+    ref_graph_gen = request.getfixturevalue(fixture_name)
+
+    _run_trials(ref_graph_gen, num_trials, check, seed_type)
 
 
 # Nothing to test for inverse_property_constraints=ignore.  In that case,
 # anything goes.
 
 
-def test_preexisting_objects(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
-    )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
+# Base class of all parsed stix2 objects.  Bound once, rather than resolving
+# the module attribute chain for every object checked.
+_STIX_BASE = stix2.base._STIXBase
 
-    ref_graph_gen = stix2generator.generation.reference_graph_generator \
-        .ReferenceGraphGenerator(obj_gen, stix_version="2.1")
 
+def test_preexisting_objects(num_trials, ref_graph_gen):
     for _ in range(num_trials):
         _, graph1 = ref_graph_gen.generate()
 
         _, graph2 = ref_graph_gen.generate(preexisting_objects=graph1)
 
         # just ensure graph2 absorbed graph1.  Anything else we can test?
-        assert all(id_ in graph2 for id_ in graph1)
+        assert graph1.keys() <= graph2.keys()
 
         # ensure all objects got parsed ok
         assert all(
-            isinstance(obj, stix2.base._STIXBase)
+            isinstance(obj, _STIX_BASE)
             for obj in graph2.values()
         )
 
 
-def test_stix2_parsing(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
-    )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
-
-    ref_graph_gen = stix2generator.generation.reference_graph_generator \
-        .ReferenceGraphGenerator(obj_gen, stix_version="2.1")
-
+def test_stix2_parsing(num_trials, ref_graph_gen):
     identity = {
         "id": "identity--74fa9f1b-897e-40dc-8f1c-d2f531c956bb",
         "type": "identity",
@@ -920,26 +1138,15 @@ def test_stix2_parsing(num_trials):
 
         # ensure our preexisting identity is still a dict, but other objects
         # were parsed.
-        for id_, obj in graph2.items():
-            if id_ == identity["id"]:
-                assert isinstance(obj, dict)
-            else:
-                assert isinstance(obj, stix2.base._STIXBase)
-
-
-def test_not_parsing(num_trials):
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=False
-    )
-    obj_gen = stix2generator.create_object_generator(obj_gen_config)
-
-    ref_graph_config = stix2generator.generation.reference_graph_generator \
-        .Config(
-            parse=False
+        preexisting = graph2.pop(identity["id"])
+        assert type(preexisting) is dict
+        assert all(
+            isinstance(obj, _STIX_BASE)
+            for obj in graph2.values()
         )
-    ref_graph_gen = stix2generator.generation.reference_graph_generator \
-        .ReferenceGraphGenerator(obj_gen, ref_graph_config, stix_version="2.1")
 
+
+def test_not_parsing(num_trials, ref_graph_gen_no_parse):
     identity = stix2.v21.Identity(
         name="Alice"
     )
@@ -949,18 +1156,15 @@ def test_not_parsing(num_trials):
             identity.id: identity
         }
 
-        _, graph2 = ref_graph_gen.generate(preexisting_objects=graph1)
+        _, graph2 = ref_graph_gen_no_parse.generate(preexisting_objects=graph1)
 
         # ensure graph2 absorbed graph1
         assert graph1.keys() <= graph2.keys()
 
         # Ensure the only parsed object is our original identity.
-        for id_, obj in graph2.items():
-            if id_ == identity.id:
-                assert isinstance(obj, stix2.v21.Identity)
-
-            else:
-                assert isinstance(obj, dict)
+        preexisting = graph2.pop(identity.id)
+        assert isinstance(preexisting, stix2.v21.Identity)
+        assert all(type(obj) is dict for obj in graph2.values())
 
 
 def test_ref_gen_with_custom():
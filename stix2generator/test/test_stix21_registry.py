@@ -3,6 +3,7 @@ import json
 import pytest
 import stix2
 import stix2.exceptions
+import stix2.registry
 
 import stix2generator
 import stix2generator.generation.object_generator
@@ -19,7 +20,41 @@ def get_stix21_spec_names():
     return registry.keys()
 
 
-STIX21_SPEC_NAMES = get_stix21_spec_names()
+# Caches stix2 classes by STIX type, for _parse_stix21().
+_STIX21_CLASSES = {}
+
+
+def _parse_stix21(obj_dict):
+    """
+    Parse a STIX 2.1 object dict by instantiating its stix2 class directly.
+    This is equivalent to stix2.parse() with custom content disallowed, but
+    SDOs, SCOs, SROs and marking definitions are all handled the same way, and
+    the class for each STIX type is only looked up once.
+
+    :param obj_dict: A STIX 2.1 object, as a dict
+    :return: The stix2 object
+    :raises stix2.exceptions.ParseError: If the object's type isn't registered
+    """
+    stix_type = obj_dict["type"]
+    cls = _STIX21_CLASSES.get(stix_type)
+    if cls is None:
+        cls = stix2.registry.class_for_type(stix_type, "2.1")
+        if cls is None:
+            raise stix2.exceptions.ParseError(
+                "Can't parse unknown object type '{}'!".format(stix_type)
+            )
+        _STIX21_CLASSES[stix_type] = cls
+
+    return cls(**obj_dict)
+
+
+STIX21_SPEC_NAMES = tuple(get_stix21_spec_names())
+
+# Distinguish between STIX object specs and "helper" specs used by STIX object
+# specs.  Only makes sense to parse objects generated from the former.
+STIX21_OBJECT_SPEC_NAMES = frozenset(
+    spec_name for spec_name in STIX21_SPEC_NAMES if spec_name[0].isupper()
+)
 
 
 @pytest.fixture(scope="module")
@@ -75,16 +110,8 @@ def test_generation_random_props(generator_random_props, spec_name, num_trials):
         # Ensure json-serializability
         json.dumps(obj_dict, ensure_ascii=False)
 
-        # Distinguish between a STIX object spec and a "helper" spec used
-        # by STIX object specs.  Only makes sense to stix2.parse() the former.
-        if spec_name[0].isupper():
-            try:
-                stix2.parse(obj_dict, version="2.1")
-            except stix2.exceptions.ParseError:
-                # Maybe we can use this to mean this was an SCO?
-                # Try a re-parse as an SCO.  Need a better way to make the
-                # distinction...
-                stix2.parse_observable(obj_dict, version="2.1")
+        if spec_name in STIX21_OBJECT_SPEC_NAMES:
+            _parse_stix21(obj_dict)
 
 
 @pytest.mark.parametrize("spec_name", STIX21_SPEC_NAMES)
@@ -95,16 +122,8 @@ def test_generation_min_props(generator_min_props, spec_name):
     # Ensure json-serializability
     json.dumps(obj_dict, ensure_ascii=False)
 
-    # Distinguish between a STIX object spec and a "helper" spec used
-    # by STIX object specs.  Only makes sense to stix2.parse() the former.
-    if spec_name[0].isupper():
-        try:
-            stix2.parse(obj_dict, version="2.1")
-        except stix2.exceptions.ParseError:
-            # Maybe we can use this to mean this was an SCO?
-            # Try a re-parse as an SCO.  Need a better way to make the
-            # distinction...
-            stix2.parse_observable(obj_dict, version="2.1")
+    if spec_name in STIX21_OBJECT_SPEC_NAMES:
+        _parse_stix21(obj_dict)
 
 
 @pytest.mark.parametrize("spec_name", STIX21_SPEC_NAMES)
@@ -115,16 +134,8 @@ def test_generation_all_props(generator_all_props, spec_name):
     # Ensure json-serializability
     json.dumps(obj_dict, ensure_ascii=False)
 
-    # Distinguish between a STIX object spec and a "helper" spec used
-    # by STIX object specs.  Only makes sense to stix2.parse() the former.
-    if spec_name[0].isupper():
-        try:
-            stix2.parse(obj_dict, version="2.1")
-        except stix2.exceptions.ParseError:
-            # Maybe we can use this to mean this was an SCO?
-            # Try a re-parse as an SCO.  Need a better way to make the
-            # distinction...
-            stix2.parse_observable(obj_dict, version="2.1")
+    if spec_name in STIX21_OBJECT_SPEC_NAMES:
+        _parse_stix21(obj_dict)
 
 
 # Test "relationship" separately since it is lower-cased, but nevertheless
@@ -137,19 +148,19 @@ def test_generation_random_props_relationship(
     for _ in range(num_trials):
         rel_dict = generator_random_props.generate("relationship")
         json.dumps(rel_dict, ensure_ascii=False)
-        stix2.parse(rel_dict, version="2.1")
+        _parse_stix21(rel_dict)
 
 
 def test_generation_min_props_relationship(generator_min_props):
     rel_dict = generator_min_props.generate("relationship")
     json.dumps(rel_dict, ensure_ascii=False)
-    stix2.parse(rel_dict, version="2.1")
+    _parse_stix21(rel_dict)
 
 
 def test_generation_all_props_relationship(generator_all_props):
     rel_dict = generator_all_props.generate("relationship")
     json.dumps(rel_dict, ensure_ascii=False)
-    stix2.parse(rel_dict, version="2.1")
+    _parse_stix21(rel_dict)
 
 
 # Similar for sightings.
@@ -160,16 +171,16 @@ def test_generation_random_props_sighting(
     for _ in range(num_trials):
         rel_dict = generator_random_props.generate("sighting")
         json.dumps(rel_dict, ensure_ascii=False)
-        stix2.parse(rel_dict, version="2.1")
+        _parse_stix21(rel_dict)
 
 
 def test_generation_min_props_sighting(generator_min_props):
     rel_dict = generator_min_props.generate("sighting")
     json.dumps(rel_dict, ensure_ascii=False)
-    stix2.parse(rel_dict, version="2.1")
+    _parse_stix21(rel_dict)
 
 
 def test_generation_all_props_sighting(generator_all_props):
     rel_dict = generator_all_props.generate("sighting")
     json.dumps(rel_dict, ensure_ascii=False)
-    stix2.parse(rel_dict, version="2.1")
+    _parse_stix21(rel_dict)
@@ -35,17 +35,17 @@ def cleanup_stix2():
     # to recognize from now on, if any entries are "custom".
     if _STIX2_BUILTIN_SDO_NAMES is None:
         _STIX2_BUILTIN_SDO_NAMES = {
-            stix_vid: set(entries["objects"])
+            stix_vid: frozenset(entries["objects"])
             for stix_vid, entries in mappings.STIX2_OBJ_MAPS.items()
         }
 
     yield
 
     for stix_vid, entries in mappings.STIX2_OBJ_MAPS.items():
-        to_delete = [  # avoid modify-as-you-iterate
-            obj_type for obj_type in entries["objects"]
-            if obj_type not in _STIX2_BUILTIN_SDO_NAMES[stix_vid]
-        ]
+        # Materialize as a list to avoid modify-as-you-iterate
+        to_delete = list(
+            entries["objects"].keys() - _STIX2_BUILTIN_SDO_NAMES[stix_vid]
+        )
 
         for custom_type in to_delete:
             # print("Cleaning for", stix_vid, ":", custom_type)
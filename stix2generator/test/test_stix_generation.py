@@ -1,4 +1,6 @@
-import itertools
+import functools
+import operator
+import types
 
 import pytest
 import stix2.base
@@ -6,8 +8,6 @@ import stix2.utils
 
 import stix2generator
 import stix2generator.exceptions
-import stix2generator.generation.object_generator
-import stix2generator.generation.stix_generator
 import stix2generator.test.utils
 import stix2generator.utils
 
@@ -38,26 +38,25 @@ def test_bad_seed(stix21_generator):
         stix21_generator.generate("foo")
 
 
+_is_sro21 = functools.partial(stix2.utils.is_sro, stix_version="2.1")
+_get_type = operator.itemgetter("type")
+
+
 def _count_relationships(graph):
     """
     Counts the number of relationships (plain and sighting) in the graph.
     """
-    count = sum(
-        1 if stix2.utils.is_sro(obj, "2.1") else 0
-        for obj in graph.values()
-    )
+    count = sum(map(_is_sro21, graph.values()))
 
     return count
 
 
-def test_relationship_count(num_trials):
-    stix_gen_config = stix2generator.generation.stix_generator.Config(
-        min_relationships=2,
-        max_relationships=5
-    )
-
-    stix_gen = stix2generator.create_stix_generator(
-        stix_generator_config=stix_gen_config
+def test_relationship_count(num_trials, stix_generator_factory):
+    stix_gen = stix_generator_factory(
+        stix_generator_config={
+            "min_relationships": 2,
+            "max_relationships": 5
+        }
     )
 
     for _ in range(num_trials):
@@ -66,27 +65,19 @@ def test_relationship_count(num_trials):
         assert 2 <= rel_count <= 5
 
 
-def test_complete_ref_properties_true(num_trials):
-    stix_gen_config = stix2generator.generation.stix_generator.Config(
-        complete_ref_properties=True
-    )
-
-    stix_gen = stix2generator.create_stix_generator(
-        stix_generator_config=stix_gen_config
+def test_complete_ref_properties_true(num_trials, stix_generator_factory):
+    stix_gen = stix_generator_factory(
+        stix_generator_config={"complete_ref_properties": True}
     )
 
     for _ in range(num_trials):
         graph = stix_gen.generate()
-        assert not stix2generator.test.utils.has_dangling_references(graph)
-
+        assert not stix2generator.test.utils.dangling_references(graph)
 
-def test_complete_ref_properties_false(num_trials):
-    stix_gen_config = stix2generator.generation.stix_generator.Config(
-        complete_ref_properties=False
-    )
 
-    stix_gen = stix2generator.create_stix_generator(
-        stix_generator_config=stix_gen_config
+def test_complete_ref_properties_false(num_trials, stix_generator_factory):
+    stix_gen = stix_generator_factory(
+        stix_generator_config={"complete_ref_properties": False}
     )
 
     for _ in range(num_trials):
@@ -115,23 +106,28 @@ def test_complete_ref_properties_false(num_trials):
             assert not stix2generator.test.utils.has_dangling_references(graph)
 
 
-def test_probability_sighting(num_trials):
-    stix_gen_config = stix2generator.generation.stix_generator.Config(
-        probability_sighting=0
-    )
+def _any_sighting(graph):
+    """
+    Determine whether the given graph contains any sightings.
 
-    stix_gen = stix2generator.create_stix_generator(
-        stix_generator_config=stix_gen_config
+    :param graph: The STIX graph as a mapping from ID to object
+    :return: True if there is a sighting; False if not
+    """
+    # Membership testing against a map() iterator scans in C, and stops at
+    # the first match.
+    result = "sighting" in map(_get_type, graph.values())
+
+    return result
+
+
+def test_probability_sighting(num_trials, stix_generator_factory):
+    stix_gen = stix_generator_factory(
+        stix_generator_config={"probability_sighting": 0}
     )
 
     for _ in range(num_trials):
         graph = stix_gen.generate()
-        has_sighting = any(
-            obj["type"] == "sighting"
-            for obj in graph.values()
-        )
-
-        assert not has_sighting
+        assert not _any_sighting(graph)
 
     # can't test that probability_sighting=1 results in *only*
     # sightings, because STIX graph generation can't guarantee that.
@@ -143,176 +139,50 @@ def test_connectedness(num_trials, stix21_generator):
         assert stix2generator.test.utils.is_connected(graph)
 
 
-class _FilterFirst:
-    """
-    Instances act as a predicate which is used to filter out only the first
-    occurrence of some value.
-    """
-    def __init__(self, filter_value):
-        """
-        Initialize this predicate object.
-
-        :param filter_value: The value whose first occurrence this predicate
-            should filter out.
-        """
-        self.filter_value = filter_value
-        self.found = False
-
-    def __call__(self, value):
-        """
-        Check whether the given value should pass this filter.
-
-        :param value: A value
-        :return: True if the value passes this filter; False if not
-        """
-        passes = True
-        if value == self.filter_value and not self.found:
-            self.found = True
-            passes = False
-
-        return passes
-
-
-def _sro_relates(sro, id_):
+def _sro_endpoint_ids(sro):
     """
-    Determine whether the given SRO relates an object with the given ID to
-    any other object.
+    Find the IDs of all objects the given SRO relates.  If an ID occurs in
+    several ref properties of the SRO, it is included once per occurrence.
 
     :param sro: An SRO
-    :param id_: A STIX ID
-    :return: True if SRO relates id_ to something; False if not
+    :return: A list of STIX IDs
     """
-    sro_type = sro["type"]
-    if sro_type == "relationship":
-        relates = id_ in (sro["source_ref"], sro["target_ref"])
+    if sro["type"] == "relationship":
+        endpoint_ids = [sro["source_ref"], sro["target_ref"]]
 
     else:
         # sightings
-        relates = id_ == sro["sighting_of_ref"] \
-            or id_ in sro.get("observed_data_refs", []) \
-            or id_ in sro.get("where_sighted_refs", [])
+        endpoint_ids = [sro["sighting_of_ref"]]  # always one of these
+        endpoint_ids.extend(sro.get("observed_data_refs", ()))
+        endpoint_ids.extend(sro.get("where_sighted_refs", ()))
 
-    return relates
+    return endpoint_ids
 
 
-def _get_sro_other_ends(sro, this_end_id):
+def _classify_ids(graph):
     """
-    Given an SRO and and the ID of an object it relates, find all the IDs
-    of other objects it relates the given ID to.  This is a generator which
-    yields STIX IDs.
-
-    :param sro: An SRO
-    :param this_end_id: A STIX ID which the SRO relates to other things
-    """
-
-    sro_type = sro["type"]
-
-    if sro_type == "relationship":
-        other_end_id = sro["target_ref"] \
-            if this_end_id == sro["source_ref"] \
-            else sro["source_ref"]
-
-        yield other_end_id
-
-    else:
-        # sightings
-        observed_data_refs = sro.get("observed_data_refs")
-        where_sighted_refs = sro.get("where_sighted_refs")
-        sighting_of_refs = (sro["sighting_of_ref"],)  # always one of these
-
-        # We assume this_end_id exists in some relevant ref property for
-        # the sighting: that's one "end" of it.  All other ref IDs are the
-        # other "ends".  In fact, this_end_id could occur multiple times.
-        # We don't care where it occurs, but one of those is this end, and
-        # all others are other ends.  The net result is that we want all ref
-        # IDs from the relevant ref properties, minus a single ID matching
-        # this_end_id.  The following simply filters out the first occurrence
-        # as "this end".
-
-        # chain together all of the ref IDs in the sighting
-        all_refs = itertools.chain.from_iterable(
-            seq for seq in (
-                observed_data_refs, where_sighted_refs, sighting_of_refs
-            ) if seq
-        )
-
-        # filter the first occurrence of this_end_id from the chain
-        filter_first_pred = _FilterFirst(this_end_id)
-        filtered_all_refs = (
-            id_ for id_ in all_refs if filter_first_pred(id_)
-        )
-
-        yield from filtered_all_refs
-
-
-def _sro_cycle_undirected_dfs(
-    graph, curr_id, visited_ids=None, search_stack=None
-):
-    """
-    Do a depth-first-search starting from curr_id in the given graph, and look
-    for cycles.  This treats SROs as edges, and SROs' "endpoints" as graph
-    nodes.  SRO directionality is ignored (sightings don't have a "direction"
-    anyway).
+    Classify the objects of the given graph as SROs or SRO endpoints, in one
+    pass, so that searches need not re-classify objects as they go.
 
     :param graph: The STIX graph as a mapping from ID to object
-    :param curr_id: A start object ID for the search.  Must be an SDO or SCO
-        ID (a type usable as an SRO endpoint).
-    :param visited_ids: A set of IDs of objects we've already seen.  Prevents
-        re-traversing the same graph regions multiple times
-    :param search_stack: A search stack which builds up a path from the
-        start node to other nodes.  This is used to detect the cycles.
-    :return: True if a cycle is detected; False if not
+    :return: A 2-tuple of sets: the SRO IDs, and the IDs of objects which are
+        usable as SRO endpoints (SDOs and SCOs)
     """
-    if visited_ids is None:
-        visited_ids = set()
-
-    if search_stack is None:
-        search_stack = []
+    sro_ids = set()
+    endpoint_ids = set()
 
-    if curr_id in search_stack:
-        result = True
-
-    elif curr_id in visited_ids:
-        result = False
-
-    elif curr_id not in graph:
-        # dangling reference
-        result = False
-
-    else:
-        visited_ids.add(curr_id)
-        search_stack.append(curr_id)
-
-        for id_, obj in graph.items():
-            # Need to add the SROs to the stack too, because we don't want to
-            # reuse them in a cycle.  Cycles require distinct objects *and*
-            # distinct SROs.
-            if stix2.utils.is_sro(obj, "2.1") \
-                    and id_ not in search_stack \
-                    and _sro_relates(obj, curr_id):
-
-                search_stack.append(id_)
-
-                for other_end_id in _get_sro_other_ends(obj, curr_id):
-                    result = _sro_cycle_undirected_dfs(
-                        graph, other_end_id, visited_ids, search_stack
-                    )
-
-                    if result:
-                        break
-
-                else:
-                    search_stack.pop()
-                    continue
-
-                search_stack.pop()
-                break
-        else:
-            result = False
-
-        search_stack.pop()
+    for id_, obj in graph.items():
+        if stix2.utils.is_sro(obj, "2.1"):
+            sro_ids.add(id_)
+        elif stix2.utils.is_stix_type(
+            obj,
+            "2.1",
+            stix2.utils.STIXTypeClass.SDO,
+            stix2.utils.STIXTypeClass.SCO
+        ):
+            endpoint_ids.add(id_)
 
-    return result
+    return sro_ids, endpoint_ids
 
 
 def _has_sro_cycle_undirected(graph):
@@ -323,37 +193,55 @@ def _has_sro_cycle_undirected(graph):
     :param graph: The STIX graph as a mapping from ID to object
     :return: True if a cycle is detected; False if not
     """
-    # Need to find a start node, i.e. a SRO-connectable object in the graph.
-    sro_connectable_ids = (
-        id_ for id_, obj in graph.items() if stix2.utils.is_stix_type(
-            obj,
-            "2.1",
-            stix2.utils.STIXTypeClass.SDO,
-            stix2.utils.STIXTypeClass.SCO,
-        )
-    )
-
-    first_id = next(sro_connectable_ids, None)
+    sro_ids, endpoint_ids = _classify_ids(graph)
 
     # Should not happen: it would mean the graph is empty or contains no
     # "normal" graph nodes (SDO/SCOs)!
-    assert first_id is not None
+    assert endpoint_ids
+
+    # Treat each SRO as an edge (or hyperedge, for sightings) between the
+    # objects it relates, with objects encoded as contiguous integers.  If an
+    # edge connects objects which are already connected, i.e. doesn't merge
+    # two components, it closes a cycle.
+    node_indices = {}
+    edge_ends1 = []
+    edge_ends2 = []
+
+    for sro_id in sro_ids:
+        # Dangling references can't be part of a cycle.
+        sro_endpoint_ids = [
+            id_ for id_ in _sro_endpoint_ids(graph[sro_id]) if id_ in graph
+        ]
+
+        # A sighting connects all of its endpoints through the one SRO, so
+        # its endpoints must not be treated as pairwise connected.  Joining
+        # each to the first endpoint in turn counts the sighting once.
+        if sro_endpoint_ids:
+            first_idx = node_indices.setdefault(
+                sro_endpoint_ids[0], len(node_indices)
+            )
+
+            for other_end_id in sro_endpoint_ids[1:]:
+                edge_ends1.append(first_idx)
+                edge_ends2.append(
+                    node_indices.setdefault(other_end_id, len(node_indices))
+                )
+
+    num_merges = stix2generator.test.utils.count_merges(
+        edge_ends1, edge_ends2, len(node_indices)
+    )
+
+    result = num_merges < len(edge_ends1)
 
-    result = _sro_cycle_undirected_dfs(graph, first_id)
     return result
 
 
-def test_probability_reuse(num_trials):
+def test_probability_reuse(num_trials, stix_generator_factory):
     # There shouldn't be any "cycles" if probability_reuse=0, since every
     # SRO addition results in all new objects.  I don't think there's any
     # invariant we can test when probability_reuse=1...
-    stix_gen_config = stix2generator.generation.stix_generator.Config(
-        probability_reuse=0
-    )
-
-    stix_gen = stix2generator.create_stix_generator(
-        stix_generator_config=stix_gen_config,
-        stix_version="2.1"
+    stix_gen = stix_generator_factory(
+        stix_generator_config={"probability_reuse": 0}
     )
 
     for _ in range(num_trials):
@@ -378,28 +266,27 @@ def _observable_container_has_dangling_references(observable_container):
     Check all reference properties of all SCOs in the container, and determine
     whether they reference objects which are also in the container.
 
-    :param graph: A STIX graph as a mapping from ID to object
+    :param observable_container: An observable container as a mapping from
+        ID to object
     :return: True if any references are dangling; False if not
     """
-    # This is almost a copy-paste of
+    # This is the analog of
     # stix2generator.test.utils.has_dangling_references(), but changed to work
     # on an observable-container, which is not a full STIX object.
-    for obj in observable_container.values():
-        for _, obj_id in stix2generator.utils.recurse_references(obj):
-            if obj_id not in observable_container:
-                result = True
-                break
-        else:
-            continue
+    referenced_ids = {
+        obj_id
+        for obj in observable_container.values()
+        for _, obj_id in stix2generator.utils.recurse_references(obj)
+    }
 
-        break
-    else:
-        result = False
+    result = not referenced_ids <= observable_container.keys()
 
     return result
 
 
-def test_observed_data_observable_container(num_trials):
+def test_observed_data_observable_container(
+    num_trials, stix_generator_factory
+):
     """
     Because of observed-data special-casing which occurs in the codebase,
     this test is intended to ensure that SDO in particular isn't getting messed
@@ -409,11 +296,8 @@ def test_observed_data_observable_container(num_trials):
     # the new "object_refs" property), configure the object generator to
     # minimize properties.  This will inhibit "object_refs" (since that's a ref
     # property) and force "objects".
-    obj_gen_config = stix2generator.generation.object_generator.Config(
-        minimize_ref_properties=True
-    )
-    stix_gen = stix2generator.create_stix_generator(
-        object_generator_config=obj_gen_config
+    stix_gen = stix_generator_factory(
+        object_generator_config={"minimize_ref_properties": True}
     )
     for _ in range(num_trials):
         graph = stix_gen.generate("observed-data")
@@ -442,23 +326,38 @@ def test_preexisting_objects(stix21_generator, num_trials):
         )
 
 
+# Preexisting content for the parsing tests: an unparsed and a parsed
+# identity, each in a read-only graph shared by all trials.  The generator
+# adds to any map it is given, so trials pass it a copy; the read-only
+# proxies ensure a mutation of the shared graph would fail loudly.
+_UNPARSED_IDENTITY = {
+    "id": "identity--74fa9f1b-897e-40dc-8f1c-d2f531c956bb",
+    "type": "identity",
+    "spec_version": "2.1"
+    # Omit the required "name" property.
+    # Should be ok since the property is not used by any generators,
+    # and we don't expect this dict to be parsed and produce any
+    # validation errors.
+}
+
+_UNPARSED_IDENTITY_GRAPH = types.MappingProxyType({
+    _UNPARSED_IDENTITY["id"]: _UNPARSED_IDENTITY
+})
+
+_PARSED_IDENTITY = stix2.v21.Identity(
+    name="Alice"
+)
+
+_PARSED_IDENTITY_GRAPH = types.MappingProxyType({
+    _PARSED_IDENTITY.id: _PARSED_IDENTITY
+})
+
+
 def test_stix2_parsing(stix21_generator, num_trials):
-    identity = {
-        "id": "identity--74fa9f1b-897e-40dc-8f1c-d2f531c956bb",
-        "type": "identity",
-        "spec_version": "2.1"
-        # Omit the required "name" property.
-        # Should be ok since the property is not used by any generators,
-        # and we don't expect this dict to be parsed and produce any
-        # validation errors.
-    }
+    graph1 = _UNPARSED_IDENTITY_GRAPH
 
     for _ in range(num_trials):
-        graph1 = {
-            identity["id"]: identity
-        }
-
-        graph2 = stix21_generator.generate(preexisting_objects=graph1)
+        graph2 = stix21_generator.generate(preexisting_objects=dict(graph1))
 
         # ensure graph2 absorbed graph1
         assert graph1.keys() <= graph2.keys()
@@ -466,70 +365,44 @@ def test_stix2_parsing(stix21_generator, num_trials):
         # ensure our preexisting identity is still a dict, but other objects
         # were parsed.
         for id_, obj in graph2.items():
-            if id_ == identity["id"]:
+            if id_ == _UNPARSED_IDENTITY["id"]:
                 assert isinstance(obj, dict)
             else:
                 assert isinstance(obj, stix2.base._STIXBase)
 
 
-def test_not_stix2_parsing(num_trials):
-    stix_gen_config = stix2generator.generation.stix_generator.Config(
-        parse=False
-    )
-
-    ref_graph_config = stix2generator.generation.reference_graph_generator \
-        .Config(
-            parse=False
-        )
-
-    stix_gen = stix2generator.create_stix_generator(
-        stix_generator_config=stix_gen_config,
-        ref_graph_generator_config=ref_graph_config,
-        stix_version="2.1"
+def test_not_stix2_parsing(num_trials, stix_generator_factory):
+    stix_gen = stix_generator_factory(
+        ref_graph_generator_config={"parse": False},
+        stix_generator_config={"parse": False}
     )
 
-    identity = stix2.v21.Identity(
-        name="Alice"
-    )
+    graph1 = _PARSED_IDENTITY_GRAPH
 
     for _ in range(num_trials):
-        graph1 = {
-            identity.id: identity
-        }
-
-        graph2 = stix_gen.generate(preexisting_objects=graph1)
+        graph2 = stix_gen.generate(preexisting_objects=dict(graph1))
 
         # ensure graph2 absorbed graph1
         assert graph1.keys() <= graph2.keys()
 
         # Ensure the only parsed object is our original identity.
         for id_, obj in graph2.items():
-            if id_ == identity.id:
+            if id_ == _PARSED_IDENTITY.id:
                 assert isinstance(obj, stix2.v21.Identity)
 
             else:
                 assert isinstance(obj, dict)
 
 
-def test_mixed_parse1(num_trials):
+def test_mixed_parse1(num_trials, stix_generator_factory):
 
     # Test mixed parse settings:
 
     # STIXGenerator: parse=False
     # ReferenceGraphGenerator: parse=True
-    stix_gen_config = stix2generator.generation.stix_generator.Config(
-        parse=False
-    )
-
-    ref_graph_config = stix2generator.generation.reference_graph_generator \
-        .Config(
-            parse=True
-        )
-
-    stix_gen = stix2generator.create_stix_generator(
-        stix_generator_config=stix_gen_config,
-        ref_graph_generator_config=ref_graph_config,
-        stix_version="2.1"
+    stix_gen = stix_generator_factory(
+        ref_graph_generator_config={"parse": True},
+        stix_generator_config={"parse": False}
     )
 
     for _ in range(num_trials):
@@ -538,25 +411,15 @@ def test_mixed_parse1(num_trials):
         stix_gen.generate()
 
 
-def test_mixed_parse2(num_trials):
+def test_mixed_parse2(num_trials, stix_generator_factory):
 
     # Test mixed parse settings:
 
     # STIXGenerator: parse=True
     # ReferenceGraphGenerator: parse=False
-    stix_gen_config = stix2generator.generation.stix_generator.Config(
-        parse=True
-    )
-
-    ref_graph_config = stix2generator.generation.reference_graph_generator \
-        .Config(
-            parse=False
-        )
-
-    stix_gen = stix2generator.create_stix_generator(
-        stix_generator_config=stix_gen_config,
-        ref_graph_generator_config=ref_graph_config,
-        stix_version="2.1"
+    stix_gen = stix_generator_factory(
+        ref_graph_generator_config={"parse": False},
+        stix_generator_config={"parse": True}
     )
 
     for _ in range(num_trials):
@@ -1,7 +1,11 @@
 # Unit tests for the (top-level) utils module.
+import itertools
+
 import pytest
+import stix2.registry
 import stix2.utils
 
+import stix2generator.generation.object_generator
 import stix2generator.utils
 
 
@@ -14,12 +18,43 @@ def object_generator21():
     return gen
 
 
+@pytest.mark.parametrize(
+    "it, len_it", [
+        ([1, 2, 3], None),
+        ((1, 2, 3), None),
+        ({1, 2, 3}, None),
+        ({1: "a", 2: "b", 3: "c"}.keys(), None),
+        (iter([1, 2, 3]), 3),
+        ((x for x in [1, 2, 3]), None),
+    ]
+)
+def test_rand_iterable(it, len_it):
+    value = stix2generator.utils.rand_iterable(it, len_it)
+    assert value in (1, 2, 3)
+
+
+@pytest.mark.parametrize(
+    "it, len_it", [
+        ([], None),
+        (set(), None),
+        (iter([]), 2),
+        ((x for x in []), None),
+    ]
+)
+def test_rand_iterable_empty(it, len_it):
+    with pytest.raises(Exception):
+        stix2generator.utils.rand_iterable(it, len_it)
+
+
 @pytest.mark.parametrize(
     "obj, findings", [
         ({"type": "foo", "a_ref": 1, "b_ref": 2, "c": 3}, {("a_ref", 1), ("b_ref", 2)}),
         ({"type": "foo", "a_refs": [1, 2], "b_ref": 3, "c": 4}, {("a_refs", 1), ("a_refs", 2), ("b_ref", 3)}),
         ({"type": "foo", "a": {"b": {"c_ref": 1}}}, {("c_ref", 1)}),
-        ({"type": "foo", "a": [{"b_ref": 1}, {"b_ref": 2}, {"c": [{"d_ref": 3}]}]}, {("b_ref", 1), ("b_ref", 2), ("d_ref", 3)})
+        ({"type": "foo", "a": [{"b_ref": 1}, {"b_ref": 2}, {"c": [{"d_ref": 3}]}]}, {("b_ref", 1), ("b_ref", 2), ("d_ref", 3)}),
+        ({"type": "foo", "a": ({"b_ref": 1},), "c": {"d": iter([{"e_ref": 2}])}}, {("b_ref", 1), ("e_ref", 2)}),
+        ({"type": "observed-data", "a_ref": 1, "objects": {"0": {"b_ref": 2}}}, {("a_ref", 1)}),
+        ({"type": "foo", "a_ref": 1, "objects": {"0": {"b_ref": 2}}}, {("a_ref", 1), ("b_ref", 2)})
     ]
 )
 def test_find_references(obj, findings):
@@ -74,6 +109,33 @@ def test_random_generatable_stix_type(
         object_generator21.generate(type_)
 
 
+@pytest.mark.parametrize(
+    "constraints", [
+        (("identity", "marking-definition", "foo")),
+        ((stix2.utils.STIXTypeClass.SDO,)),
+        ((stix2.utils.STIXTypeClass.SCO, "campaign")),
+        ((stix2.utils.STIXTypeClass.SRO, "bundle")),
+        ((
+                stix2.utils.STIXTypeClass.SDO,
+                stix2.utils.STIXTypeClass.SCO,
+                stix2.utils.STIXTypeClass.SRO
+        )),
+        (()),
+    ]
+)
+def test_generatable_stix_types(object_generator21, constraints):
+    types = stix2generator.utils.generatable_stix_types(
+        object_generator21, *constraints, stix_version="2.1"
+    )
+
+    expected_types = [
+        type_ for type_ in object_generator21.spec_names
+        if stix2.utils.is_stix_type(type_, "2.1", *constraints)
+    ]
+
+    assert types == expected_types
+
+
 @pytest.mark.parametrize(
     "constraints", [
         (("foo", "bar")),
@@ -89,3 +151,140 @@ def test_random_generatable_stix_type_not_found(
         )
 
         assert type_ is None
+
+
+@pytest.mark.parametrize(
+    "value, types", [
+        ("identity", ("identity",)),
+        ("identity", (stix2.utils.STIXTypeClass.SDO,)),
+        ("identity", (stix2.utils.STIXTypeClass.SCO,)),
+        ("identity--74fa9f1b-897e-40dc-8f1c-d2f531c956bb", ("identity",)),
+        ("ipv4-addr", (stix2.utils.STIXTypeClass.SDO, "url")),
+        ("ipv4-addr", (stix2.utils.STIXTypeClass.SDO, "ipv4-addr")),
+        ("sighting", (stix2.utils.STIXTypeClass.SRO,)),
+        ("foo", (stix2.utils.STIXTypeClass.SDO,)),
+        ("identity", ()),
+        ({"type": "identity", "spec_version": "2.1"}, ("identity",)),
+        ({"type": "identity"}, (stix2.utils.STIXTypeClass.SDO,))
+    ]
+)
+def test_is_stix_type(value, types):
+    # Twice, to exercise cached results
+    for _ in range(2):
+        assert stix2generator.utils.is_stix_type(value, "2.1", *types) \
+            == stix2.utils.is_stix_type(value, "2.1", *types)
+
+
+@pytest.mark.parametrize(
+    "types", [
+        (stix2.utils.STIXTypeClass.SDO,),
+        (stix2.utils.STIXTypeClass.SCO,),
+        (stix2.utils.STIXTypeClass.SRO,),
+        ("bundle", "marking-definition", "language-content"),
+        (stix2.utils.STIXTypeClass.SRO, "file", "foo"),
+    ]
+)
+def test_is_stix_type_all_registered(types):
+    cls_maps = stix2.registry.STIX2_OBJ_MAPS["2.1"]
+    for type_ in itertools.chain(
+        cls_maps["objects"], cls_maps["observables"], ["foo"]
+    ):
+        assert stix2generator.utils.is_stix_type(type_, "2.1", *types) \
+            == stix2.utils.is_stix_type(type_, "2.1", *types)
+
+
+def test_is_stix_type_registration():
+    type_name = "x-test-is-stix-type"
+    sdo = stix2.utils.STIXTypeClass.SDO
+
+    assert not stix2generator.utils.is_stix_type(type_name, "2.1", sdo)
+
+    @stix2.v21.CustomObject(type_name, [])
+    class TestType:
+        pass
+
+    try:
+        assert stix2generator.utils.is_stix_type(type_name, "2.1", sdo)
+    finally:
+        del stix2.registry.STIX2_OBJ_MAPS["2.1"]["objects"][type_name]
+
+    assert not stix2generator.utils.is_stix_type(type_name, "2.1", sdo)
+
+
+def test_is_stix_type_registration_swap():
+    # Unregistering one type and registering another leaves the registry the
+    # same size; results must still follow the registry.
+    type_name1 = "x-test-is-stix-type-aaa"
+    type_name2 = "x-test-is-stix-type-bbb"
+    sdo = stix2.utils.STIXTypeClass.SDO
+    obj_map = stix2.registry.STIX2_OBJ_MAPS["2.1"]["objects"]
+
+    @stix2.v21.CustomObject(type_name1, [])
+    class TestType1:
+        pass
+
+    try:
+        assert stix2generator.utils.is_stix_type(type_name1, "2.1", sdo)
+    finally:
+        del obj_map[type_name1]
+
+    @stix2.v21.CustomObject(type_name2, [])
+    class TestType2:
+        pass
+
+    try:
+        assert not stix2generator.utils.is_stix_type(type_name1, "2.1", sdo)
+        assert stix2generator.utils.is_stix_type(type_name2, "2.1", sdo)
+    finally:
+        del obj_map[type_name2]
+
+
+def test_generatable_stix_types_registration():
+    # Type names the generator has specs for, but which aren't registered,
+    # must become candidates as soon as they're registered.
+    type_name = "x-test-generatable-stix-type"
+    sdo = stix2.utils.STIXTypeClass.SDO
+    obj_map = stix2.registry.STIX2_OBJ_MAPS["2.1"]["objects"]
+
+    gen = stix2generator.generation.object_generator.ObjectGenerator({
+        type_name: {"type": "object", "properties": {}}
+    })
+
+    assert stix2generator.utils.generatable_stix_types(
+        gen, sdo, stix_version="2.1"
+    ) == []
+
+    @stix2.v21.CustomObject(type_name, [])
+    class TestType:
+        pass
+
+    try:
+        assert stix2generator.utils.generatable_stix_types(
+            gen, sdo, stix_version="2.1"
+        ) == [type_name]
+    finally:
+        del obj_map[type_name]
+
+    assert stix2generator.utils.generatable_stix_types(
+        gen, sdo, stix_version="2.1"
+    ) == []
+
+
+def test_random_generatable_stix_type_spec_swap():
+    # The generator uses the registry it was given as-is, so changes to the
+    # registry must be reflected, even if it stays the same size.
+    spec_registry = {"identity": {"type": "object", "properties": {}}}
+    gen = stix2generator.generation.object_generator.ObjectGenerator(
+        spec_registry
+    )
+
+    assert stix2generator.utils.random_generatable_stix_type(
+        gen, stix2.utils.STIXTypeClass.SDO, stix_version="2.1"
+    ) == "identity"
+
+    del spec_registry["identity"]
+    spec_registry["campaign"] = {"type": "object", "properties": {}}
+
+    assert stix2generator.utils.random_generatable_stix_type(
+        gen, stix2.utils.STIXTypeClass.SDO, stix_version="2.1"
+    ) == "campaign"
@@ -4,92 +4,115 @@ Utilities useful for unit tests.
 import stix2generator.utils
 
 
-def has_dangling_references(graph):
+def count_merges(edge_ends1, edge_ends2, num_nodes):
     """
-    Check all reference properties of all objects in the graph, and determine
-    whether they reference objects which are also in the graph.
-
-    :param graph: A STIX graph as a mapping from ID to object
-    :return: True if any references are dangling; False if not
+    Treat the given edges as undirected and count how many of them connect
+    previously unconnected nodes, when added in order.  The nodes form one
+    connected component iff the count is num_nodes - 1; the edges contain a
+    cycle iff the count is less than the number of edges.  This is a
+    union-find over the integer-encoded nodes.
+
+    :param edge_ends1: A sequence of node indices, one end of each edge
+    :param edge_ends2: A sequence of node indices, the other end of each edge
+    :param num_nodes: The number of nodes; node indices must be less than this
+    :return: The number of merging edges
     """
-    for obj in graph.values():
-        for _, obj_id in stix2generator.utils.find_references(obj):
-            if obj_id not in graph:
-                result = True
-                break
-        else:
-            continue
-
-        break
-    else:
-        result = False
+    parents = list(range(num_nodes))
+    sizes = [1] * num_nodes
 
-    return result
+    num_merges = 0
+    for i in range(len(edge_ends1)):
+        # Find both roots, halving paths along the way
+        root1 = edge_ends1[i]
+        while parents[root1] != root1:
+            parents[root1] = parents[parents[root1]]
+            root1 = parents[root1]
 
+        root2 = edge_ends2[i]
+        while parents[root2] != root2:
+            parents[root2] = parents[parents[root2]]
+            root2 = parents[root2]
 
-def _ref_dfs(graph, curr_id, new_ids, visited_ids):
-    """
-    Do a depth-first-search via reference properties starting at node
-    curr_id, and add any IDs encountered which are not in visited_ids, to
-    new_ids.  Note that dangling references, i.e. references to non-existent
-    objects are not added to new_ids.
+        if root1 != root2:
+            # Union by size
+            if sizes[root1] < sizes[root2]:
+                root1, root2 = root2, root1
 
-    This allows you to see a kind of "delta": given an ID, those IDs it makes
-    newly reachable relative to the set of IDs you've already seen.
+            parents[root2] = root1
+            sizes[root1] += sizes[root2]
+            num_merges += 1
+
+    return num_merges
+
+
+def find_graph_references(graph):
+    """
+    Find the references of all objects in the graph.  Walking objects to find
+    references is the main cost of the graph checks in this module, so this
+    allows several checks on the same graph to share one walk.
 
     :param graph: A STIX graph as a mapping from ID to object
-    :param curr_id: The ID of a start node for DFS
-    :param new_ids: A set which collects "new" IDs encountered, i.e. those
-        encountered which are not in visited_ids.  This includes curr_id
-        itself, if it has not already been seen.
-    :param visited_ids: A set of previously found IDs.  This set is not
-        modified.
+    :return: A map from object ID to a tuple of the IDs the object references
     """
+    references = {
+        id_: tuple(
+            ref_id
+            for _, ref_id in stix2generator.utils.find_references(obj)
+        )
+        for id_, obj in graph.items()
+    }
 
-    if curr_id in new_ids or curr_id in visited_ids:
-        return
+    return references
 
-    curr_node = graph.get(curr_id)
-    if curr_node is None:
-        # a dangling reference
-        return
 
-    new_ids.add(curr_id)
+def has_dangling_references(graph, references=None):
+    """
+    Check all reference properties of all objects in the graph, and determine
+    whether they reference objects which are also in the graph.
 
-    for _, id_ in stix2generator.utils.find_references(curr_node):
-        _ref_dfs(graph, id_, new_ids, visited_ids)
+    :param graph: A STIX graph as a mapping from ID to object
+    :param references: The graph's references as produced by
+        find_graph_references(), or None to find them
+    :return: True if any references are dangling; False if not
+    """
+    if references is None:
+        references = find_graph_references(graph)
 
+    result = any(
+        ref_id not in graph
+        for ref_ids in references.values()
+        for ref_id in ref_ids
+    )
 
-def _find_new_referring_ids(graph, new_ids, visited_ids):
-    """
-    Find IDs of objects which refer to an object with an ID in new_ids, which
-    have not themselves already been seen.
+    return result
 
-    This allows you to take a sort of "upstream" step when traversing a STIX
-    graph.  If "downstream" means following a ref property to its referent,
-    this function allows you to follow a referent backward to its referring
-    objects.
 
-    The "seen" objects are those with IDs in either new_ids or visited_ids.
-    new_ids is a "delta", i.e. a newly discovered set of connected IDs, which
-    comes from _ref_dfs().  So this and that function work together.
+def dangling_references(graph, references=None):
+    """
+    Find all references in the graph to objects which are not in the graph.
+    Unlike has_dangling_references(), this doesn't stop at the first one, so
+    it's useful for reporting on or fixing up a whole graph.
 
     :param graph: A STIX graph as a mapping from ID to object
-    :param new_ids: A set of STIX IDs
-    :param visited_ids: Another set of STIX IDs
-    :return: A set of IDs of objects which refer to objects with IDs in new_ids
+    :param references: The graph's references as produced by
+        find_graph_references(), or None to find them
+    :return: A list of the dangling referenced IDs, in the order they were
+        found.  An ID appears once per reference to it.
     """
-    referring_ids = set()
-    for id_, obj in graph.items():
-        if id_ not in new_ids and id_ not in visited_ids:
-            for _, ref_id in stix2generator.utils.find_references(obj):
-                if ref_id in new_ids:
-                    referring_ids.add(id_)
+    if references is None:
+        references = find_graph_references(graph)
+
+    result = [
+        ref_id
+        for ref_ids in references.values()
+        for ref_id in ref_ids
+        if ref_id not in graph
+    ]
 
-    return referring_ids
+    return result
 
 
-def is_connected(graph):
+def is_connected(graph, references=None):
     """
     Determine whether the graph is connected, i.e. whether there is any
     partitioning such that one cannot reach one partition from another by
@@ -97,9 +120,14 @@ def is_connected(graph):
     connect things via their reference properties, this works as a
     connectedness check for both reference graphs (as built by the reference
     graph generator) and SRO-based graphs.
+
+    :param graph: A STIX graph as a mapping from ID to object
+    :param references: The graph's references as produced by
+        find_graph_references(), or None to find them
+    :return: True if the graph is connected; False if not
     """
 
-    # Note that because _ref_dfs() ignores dangling references, that can cause
+    # Note that because dangling references are ignored, that can cause
     # a pattern like the following to result in a detected disconnection:
     #
     # {
@@ -113,29 +141,26 @@ def is_connected(graph):
     # very unlikely to happen.  That suggests maybe it should cause failure so
     # we can tell whether something we don't expect to happen, actually happens.
 
-    curr_id = next(iter(graph), None)
-
-    if curr_id:
-        visited_ids = set()
-        new_ids = set()
-        _ref_dfs(graph, curr_id, new_ids, visited_ids)
-        while new_ids:
-            referring_ids = _find_new_referring_ids(
-                graph, new_ids, visited_ids
-            )
+    # Merge the sets of objects each reference connects, ignoring reference
+    # direction.  (If no nodes, I guess it's considered "connected"...?
+    # Shouldn't happen though.)
+    if references is None:
+        references = find_graph_references(graph)
 
-            visited_ids |= new_ids
-            new_ids.clear()
+    node_indices = {id_: idx for idx, id_ in enumerate(graph)}
+    edge_ends1 = []
+    edge_ends2 = []
 
-            for id_ in referring_ids:
-                _ref_dfs(graph, id_, new_ids, visited_ids)
+    for id_, ref_ids in references.items():
+        id_idx = node_indices[id_]
+        for ref_id in ref_ids:
+            ref_idx = node_indices.get(ref_id)
+            if ref_idx is not None:
+                edge_ends1.append(id_idx)
+                edge_ends2.append(ref_idx)
 
-        disconnected_ids = graph.keys() - visited_ids
-        result = not bool(disconnected_ids)
+    num_merges = count_merges(edge_ends1, edge_ends2, len(node_indices))
 
-    else:
-        # If no nodes, I guess it's considered "connected"...?
-        # Shouldn't happen though.
-        result = True
+    result = num_merges >= len(graph) - 1
 
     return result
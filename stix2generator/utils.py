@@ -1,4 +1,6 @@
 import collections.abc
+import functools
+import itertools
 import random
 
 import lark
@@ -6,6 +8,37 @@ import stix2.registry
 import stix2.utils
 
 
+# Sentinel for rand_iterable(), since None is a legitimate iterable value.
+_NO_VALUE = object()
+
+
+# Reference property name suffixes.  A name ending with one of these is a
+# _ref property if its last character is "f", and a _refs property otherwise.
+_REF_SUFFIXES = ("_ref", "_refs")
+
+
+# Types registered in the stix2 library's "objects" map which are not SDOs.
+# Matches what stix2.utils.is_sdo() excludes.
+_NON_SDO_TYPES = frozenset((
+    "relationship", "sighting", "marking-definition", "bundle",
+    "language-content"
+))
+
+
+# Bit flags for classifying STIX types; see _classify_type().
+_SDO_BIT = 1
+_SCO_BIT = 2
+_SRO_BIT = 4
+_OBJECT_BIT = 8
+
+
+_TYPE_CLASS_BITS = {
+    stix2.utils.STIXTypeClass.SDO: _SDO_BIT,
+    stix2.utils.STIXTypeClass.SCO: _SCO_BIT,
+    stix2.utils.STIXTypeClass.SRO: _SRO_BIT
+}
+
+
 def is_tree(node, rule_name=None):
     """
     Determine whether the given parse tree node is a Tree node, and optionally
@@ -39,25 +72,79 @@ def is_token(node, token_type=None):
 def rand_iterable(it, len_it=None):
     """
     Choose a uniformly random value from the given iterable.  If len(it) is
-    available, len_it may be None.  Otherwise, len_it must be provided as the
-    "length" of the given iterable (the number of values which will be
+    available, len_it may be None.  Otherwise, len_it should be provided as
+    the "length" of the given iterable (the number of values which will be
     produced).
 
-    random.choice() seems to require a sequence (needs indexed access), so it
-    doesn't work with things like sets.
+    random.choice() requires a sequence (needs indexed access), so it doesn't
+    work with things like sets.  Sequences are indexed directly; other sized
+    iterables are advanced to a random position.  If the length is not known
+    at all, fall back to reservoir sampling in a single pass.
 
     :param it: The iterable
     :param len_it: The length of it, or None to obtain the length via len().
     :return: A random value from it
     """
-    if len_it is None:
-        len_it = len(it)
+    if isinstance(it, collections.abc.Sequence):
+        if not it:
+            raise Exception("Iterable was empty!")
+        result = random.choice(it)
 
-    for i, val in enumerate(it):
-        if random.random() < 1.0 / (len_it - i):
-            return val
+    elif len_it is not None or isinstance(it, collections.abc.Sized):
+        if len_it is None:
+            len_it = len(it)
+
+        if len_it <= 0:
+            raise Exception("Iterable was empty!")
+
+        result = next(
+            itertools.islice(it, random.randrange(len_it), None), _NO_VALUE
+        )
+        if result is _NO_VALUE:
+            raise Exception("Iterable was empty!")
+
+    else:
+        result = _NO_VALUE
+        for i, val in enumerate(it, 1):
+            if random.randrange(i) == 0:
+                result = val
+
+        if result is _NO_VALUE:
+            raise Exception("Iterable was empty!")
+
+    return result
+
+
+def _is_container(value):
+    """
+    Determine whether the reference walkers should descend into the given
+    value: it must be a mapping or other non-string iterable.  Anything else
+    is a leaf value, which can't contain reference properties.
+
+    :param value: The value to check
+    :return: True if the value is a container; False if not
+    """
+    return isinstance(value, collections.abc.Iterable) \
+        and not isinstance(value, str)
+
+
+def _container_iter(container):
+    """
+    Start iterating through a container, for the stack-based reference
+    walkers.
+
+    :param container: A mapping or other non-string iterable
+    :return: A (mapping, iterator) pair.  If container is a mapping, the
+        iterator produces its (key, value) pairs and mapping is the container.
+        Otherwise, the iterator produces the container's elements and mapping
+        is None.
+    """
+    if isinstance(container, collections.abc.Mapping):
+        result = container, iter(container.items())
+    else:
+        result = None, iter(container)
 
-    raise Exception("Iterable was empty!")
+    return result
 
 
 def recurse_references(obj):
@@ -68,24 +155,40 @@ def recurse_references(obj):
     observed-data/objects.
 
     :param obj: An object.  Can be any type, but values will only be produced
-        from mappings (or iterables containing mappings).
+        from mappings, and other non-string iterables are searched for
+        mappings, at any depth.
     """
-    if isinstance(obj, collections.abc.Mapping):
-        for prop, value in obj.items():
-            if prop.endswith("_ref"):
-                yield prop, value
-
-            elif prop.endswith("_refs"):
-                for ref in value:
-                    yield prop, ref
+    # Walk with an explicit stack of iterators rather than recursive
+    # generators, so nesting depth doesn't add generator frames.  Resuming
+    # the parent's iterator after a child is done keeps the same order as a
+    # recursive walk.
+    stack = []
+    if _is_container(obj):
+        stack.append(_container_iter(obj))
+
+    while stack:
+        mapping, it = stack[-1]
+        for item in it:
+            if mapping is None:
+                if _is_container(item):
+                    stack.append(_container_iter(item))
+                    break
 
             else:
-                yield from recurse_references(value)
+                prop, value = item
+                if prop.endswith(_REF_SUFFIXES):
+                    if prop[-1] == "f":
+                        yield prop, value
+                    else:
+                        for ref in value:
+                            yield prop, ref
+
+                elif _is_container(value):
+                    stack.append(_container_iter(value))
+                    break
 
-    elif isinstance(obj, collections.abc.Iterable) \
-            and not isinstance(obj, str):
-        for elt in obj:
-            yield from recurse_references(elt)
+        else:
+            stack.pop()
 
 
 def find_references(obj):
@@ -98,19 +201,23 @@ def find_references(obj):
 
     :param obj: A STIX object with a "type" property.
     """
+    # Hack for observed-data: skip the inner SCO graph.  I don't think we
+    # ever want to mix the two graphs!
+    skip_objects = obj.get("type") == "observed-data"
+
     for prop, value in obj.items():
-        if prop.endswith("_ref"):
-            yield prop, value
+        if prop.endswith(_REF_SUFFIXES):
+            if prop[-1] == "f":
+                yield prop, value
+            else:
+                for ref in value:
+                    yield prop, ref
 
-        elif prop.endswith("_refs"):
-            for ref in value:
-                yield prop, ref
+        elif skip_objects and prop == "objects":
+            pass
 
-        else:
-            # Hack for observed-data: skip the inner SCO graph.  I don't
-            # think we ever want to mix the two graphs!
-            if obj["type"] != "observed-data" or prop != "objects":
-                yield from recurse_references(value)
+        elif _is_container(value):
+            yield from recurse_references(value)
 
 
 def recurse_references_assignable(obj):
@@ -121,24 +228,37 @@ def recurse_references_assignable(obj):
     special casing for observed-data/objects.
 
     :param obj: An object.  Can be any type, but values will only be produced
-        from mappings (or iterables containing mappings).
+        from mappings, and other non-string iterables are searched for
+        mappings, at any depth.
     """
-    if isinstance(obj, collections.abc.Mapping):
-        for prop, value in obj.items():
-            if prop.endswith("_ref"):
-                yield obj, prop, value, prop
-
-            elif prop.endswith("_refs"):
-                for idx, ref_id in enumerate(value):
-                    yield value, idx, ref_id, prop
+    # Same stack-based walk as recurse_references().
+    stack = []
+    if _is_container(obj):
+        stack.append(_container_iter(obj))
+
+    while stack:
+        mapping, it = stack[-1]
+        for item in it:
+            if mapping is None:
+                if _is_container(item):
+                    stack.append(_container_iter(item))
+                    break
 
             else:
-                yield from recurse_references_assignable(value)
+                prop, value = item
+                if prop.endswith(_REF_SUFFIXES):
+                    if prop[-1] == "f":
+                        yield mapping, prop, value, prop
+                    else:
+                        for idx in range(len(value)):
+                            yield value, idx, value[idx], prop
+
+                elif _is_container(value):
+                    stack.append(_container_iter(value))
+                    break
 
-    elif isinstance(obj, collections.abc.Iterable) \
-            and not isinstance(obj, str):
-        for elt in obj:
-            yield from recurse_references_assignable(elt)
+        else:
+            stack.pop()
 
 
 def find_references_assignable(obj):
@@ -165,19 +285,150 @@ def find_references_assignable(obj):
 
     :param obj: A STIX object with a "type" property.
     """
+    # Hack for observed-data: skip the inner SCO graph.  I don't think we
+    # ever want to mix the two graphs!
+    skip_objects = obj.get("type") == "observed-data"
+
     for prop, value in obj.items():
-        if prop.endswith("_ref"):
-            yield obj, prop, value, prop
+        if prop.endswith(_REF_SUFFIXES):
+            if prop[-1] == "f":
+                yield obj, prop, value, prop
+            else:
+                for idx in range(len(value)):
+                    yield value, idx, value[idx], prop
 
-        elif prop.endswith("_refs"):
-            for idx, ref_id in enumerate(value):
-                yield value, idx, ref_id, prop
+        elif skip_objects and prop == "objects":
+            pass
 
+        elif _is_container(value):
+            yield from recurse_references_assignable(value)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_stix2_class_maps(stix_version):
+    """
+    Get the stix2 library's registry maps for the given STIX version.  The
+    library registers custom types by adding them to these maps in place, so
+    the same maps stay valid for the life of the process and it's safe to
+    memoize the lookup.
+
+    :param stix_version: A STIX version as a string
+    :return: The registry maps, as a mapping from category name ("objects",
+        "observables", etc) to a mapping from STIX type to class
+    """
+    return stix2.registry.STIX2_OBJ_MAPS[stix_version]
+
+
+def _classify_type(type_name, stix_version):
+    """
+    Classify a STIX type as a bitmask of the _*_BIT flags, according to what
+    is currently registered with the stix2 library for the given STIX version.
+    Classification agrees with stix2.utils.is_sdo(), is_sco(), is_sro() and
+    is_object().  The registry maps are checked on every call (they are plain
+    dicts), so registering or unregistering types is always picked up.
+
+    :param type_name: A STIX type as a string
+    :param stix_version: A STIX version as a string
+    :return: The type's bitmask; 0 if the type isn't recognized
+    """
+    cls_maps = _get_stix2_class_maps(stix_version)
+
+    result = 0
+    if type_name in cls_maps["objects"]:
+        result |= _OBJECT_BIT
+        if type_name not in _NON_SDO_TYPES:
+            result |= _SDO_BIT
+
+    if type_name in cls_maps["observables"]:
+        result |= _OBJECT_BIT | _SCO_BIT
+
+    # SROs are recognized by type alone; registration doesn't matter.
+    if type_name in ("relationship", "sighting"):
+        result |= _SRO_BIT
+
+    return result
+
+
+@functools.lru_cache(maxsize=64)
+def _split_type_constraints(types):
+    """
+    Split type constraints into a bitmask of the STIX type classes they allow,
+    and a set of the exact STIX types they allow.  Memoized, since generators
+    use the same few constraint combinations over and over.
+
+    :param types: A tuple of STIX type strings or STIXTypeClass enum values
+    :return: A (bitmask, frozenset of types) 2-tuple
+    """
+    class_mask = 0
+    exact_types = set()
+    for type_ in types:
+        type_class_bit = _TYPE_CLASS_BITS.get(type_)
+        if type_class_bit is None:
+            exact_types.add(type_)
         else:
-            # Hack for observed-data: skip the inner SCO graph.  I don't
-            # think we ever want to mix the two graphs!
-            if obj["type"] != "observed-data" or prop != "objects":
-                yield from recurse_references_assignable(value)
+            class_mask |= type_class_bit
+
+    return class_mask, frozenset(exact_types)
+
+
+def is_stix_type(value, stix_version, *types):
+    """
+    Equivalent to stix2.utils.is_stix_type(), but STIX type and ID strings are
+    checked against the type constraints with a single classification of the
+    type, since the same constraints are checked over and over during
+    generation.  Mappings are always checked directly, since their STIX
+    versions must be detected from their content.
+
+    :param value: A mapping with a "type" property, or a STIX ID or type
+        as a string
+    :param stix_version: A STIX version as a string
+    :param types: A sequence of STIX type strings or STIXTypeClass enum values
+    :return: True if the object or type satisfies the constraints; False if not
+    """
+    if isinstance(value, str):
+        # Plain type names (e.g. spec names) are the common case; only IDs
+        # need the type prefix sliced off.
+        sep_idx = value.find("--")
+        type_name = value if sep_idx < 0 else value[:sep_idx]
+        type_bits = _classify_type(type_name, stix_version)
+
+        class_mask, exact_types = _split_type_constraints(types)
+
+        result = bool(type_bits & class_mask) or (
+            type_name in exact_types and bool(type_bits & _OBJECT_BIT)
+        )
+
+    else:
+        result = stix2.utils.is_stix_type(value, stix_version, *types)
+
+    return result
+
+
+def generatable_stix_types(
+    object_generator, *required_types, stix_version="2.1"
+):
+    """
+    Find all STIX types which satisfy the given type constraints, and which
+    the given object generator is able to generate.  See
+    stix2.utils.is_stix_type() for more discussion on the type constraints.
+
+    :param object_generator: An object generator
+    :param required_types: Type constraints, as a sequence of STIX type strings
+        and/or STIXTypeClass enum values.  If no types are given, it means no
+        types are legal, so an empty list will always be returned.
+    :param stix_version: A STIX version as a string
+    :return: A list of STIX types; will be empty if none satisfy the given
+        constraints
+    """
+    class_mask, exact_types = _split_type_constraints(required_types)
+
+    candidate_types = []
+    for type_ in object_generator.spec_names:
+        bits = _classify_type(type_, stix_version)
+        if bits & class_mask or (type_ in exact_types and bits & _OBJECT_BIT):
+            candidate_types.append(type_)
+
+    return candidate_types
 
 
 def random_generatable_stix_type(
@@ -197,12 +448,9 @@ def random_generatable_stix_type(
         constraints; None if one could not be found
     """
 
-    candidate_types = [
-        type_ for type_ in object_generator.spec_names
-        if stix2.utils.is_stix_type(
-            type_, stix_version, *required_types
-        )
-    ]
+    candidate_types = generatable_stix_types(
+        object_generator, *required_types, stix_version=stix_version
+    )
 
     if candidate_types:
         stix_type = random.choice(candidate_types)
@@ -212,6 +460,19 @@ def random_generatable_stix_type(
     return stix_type
 
 
+@functools.lru_cache(maxsize=8)
+def _bundle_class(stix_version):
+    """
+    Get the stix2 library's Bundle class for the given STIX version.  Bundle
+    is a built-in type which can't be overridden by registration, so the
+    lookup can be memoized.
+
+    :param stix_version: A STIX version as a string
+    :return: The Bundle class
+    """
+    return stix2.registry.class_for_type("bundle", stix_version)
+
+
 def make_bundle(stix_objs, stix_version):
     """
     Creating a Bundle object of the given spec version, which contains the
@@ -223,7 +484,7 @@ def make_bundle(stix_objs, stix_version):
     :return: The Bundle object
     """
 
-    bundle_class = stix2.registry.class_for_type("bundle", stix_version)
+    bundle_class = _bundle_class(stix_version)
     bundle = bundle_class(stix_objs, allow_custom=True)
 
     return bundle
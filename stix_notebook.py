@@ -58,10 +58,10 @@ def stix(line, cell):
 
     viz_config_json = json.dumps(viz_config)
 
-    output = ''
-    output += ',\n'.join(obj.serialize(pretty=True) for obj in stix_objs)
-    if output[0] == '{':
-        if len(stix_objs) > 1:
+    serialized_objs = [obj.serialize(pretty=True) for obj in stix_objs]
+    output = ',\n'.join(serialized_objs)
+    if output.startswith('{'):
+        if len(serialized_objs) > 1:
             output = '[' + output + ']'
         viz_graph = stix2viz.display(output, viz_config_json).data
         viz_graph = re.sub(r'(<svg.* style=")', r'\1border: 2px solid #ababab;', viz_graph, 1)